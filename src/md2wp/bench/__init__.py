@@ -0,0 +1,5 @@
+from md2wp.bench.corpus import generate_corpus
+from md2wp.bench.fake_wordpress import FakeWordPress
+from md2wp.bench.runner import STAGES, run_benchmark
+
+__all__ = ["FakeWordPress", "STAGES", "generate_corpus", "run_benchmark"]
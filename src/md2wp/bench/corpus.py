@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+from html import escape
+from pathlib import Path
+
+from md2wp.config import ImportMode
+
+WORDS = (
+    "python wordpress hugo markdown import export render parse cache stream "
+    "server client request response payload latency throughput buffer thread "
+    "process worker queue batch index archive draft publish category tag "
+    "content theme template widget plugin database migrate deploy release"
+).split()
+TAGS = ["Go", "Python", "Hugo", "WordPress", "DevOps", "Linux", "Databases", "Testing"]
+CATEGORIES = ["TechBlog", "Notes", "Tutorials", "Releases"]
+COMPLETE_MARKER = ".complete"
+START = datetime(2015, 1, 1, 8, 0, tzinfo=timezone.utc)
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _paragraph(rng: random.Random) -> str:
+    return " ".join(_sentence(rng, rng.randint(8, 18)) for _ in range(rng.randint(3, 6)))
+
+
+def _code_block(rng: random.Random) -> str:
+    lines = [f"def {rng.choice(WORDS)}_{i}(value):\n    return value * {i}" for i in range(3)]
+    return "```python\n" + "\n\n".join(lines) + "\n```"
+
+
+def _table(rng: random.Random) -> str:
+    rows = [
+        f"| {rng.choice(WORDS)} | {rng.randint(1, 999)} | {rng.random():.3f} |" for _ in range(5)
+    ]
+    return "| Name | Count | Ratio |\n| --- | ---: | ---: |\n" + "\n".join(rows)
+
+
+def _markdown_body(rng: random.Random) -> str:
+    blocks = [_paragraph(rng)]
+    for section in range(rng.randint(2, 4)):
+        blocks.append(f"## {_sentence(rng, 3)[:-1]} {section + 1}")
+        blocks.append(_paragraph(rng))
+        if rng.random() < 0.6:
+            blocks.append(_code_block(rng))
+        if rng.random() < 0.4:
+            blocks.append(_table(rng))
+        blocks.append("- " + "\n- ".join(_sentence(rng, 5) for _ in range(3)))
+    return "\n\n".join(blocks) + "\n"
+
+
+def _post_fields(rng: random.Random, index: int) -> dict:
+    date = START + timedelta(hours=7 * index, minutes=rng.randint(0, 59))
+    return {
+        "title": f"{_sentence(rng, rng.randint(3, 7))[:-1]} #{index}",
+        "date": date,
+        "slug": f"post-{index:06d}",
+        "tags": rng.sample(TAGS, rng.randint(1, 3)),
+        "category": rng.choice(CATEGORIES),
+        "excerpt": _sentence(rng, 12),
+    }
+
+
+def _markdown_document(rng: random.Random, index: int) -> tuple[Path, str]:
+    fields = _post_fields(rng, index)
+    date = fields["date"]
+    tags = "\n".join(f"  - {tag}" for tag in fields["tags"])
+    text = (
+        "---\n"
+        f'title: "{fields["title"]}"\n'
+        f"date: {date.isoformat()}\n"
+        f"slug: {fields['slug']}\n"
+        f"url: /{date:%Y/%m}/{fields['slug']}/\n"
+        f"tags:\n{tags}\n"
+        f"categories:\n  - {fields['category']}\n"
+        f'excerpt: "{fields["excerpt"]}"\n'
+        f"shortlink: https://example.com/?p={index}\n"
+        "---\n\n" + _markdown_body(rng)
+    )
+    return Path(f"{date:%Y}") / f"{date:%m}" / f"{fields['slug']}.md", text
+
+
+def _hugo_document(rng: random.Random, index: int) -> tuple[Path, str]:
+    import markdown
+
+    fields = _post_fields(rng, index)
+    date = fields["date"]
+    content = markdown.markdown(_markdown_body(rng), extensions=["fenced_code", "tables"])
+    tags = "".join(
+        f'<li><a href="/tags/{tag.lower()}/">{escape(tag)}</a></li>' for tag in fields["tags"]
+    )
+    category = fields["category"]
+    text = (
+        '<!DOCTYPE html>\n<html lang="en">\n'
+        f"<head><title>{escape(fields['title'])}</title></head>\n<body>\n<article>\n"
+        f'<h1 class="post-title">{escape(fields["title"])}</h1>\n'
+        f'<div class="post-meta"><span title="{date:%a, %d %b %Y %H:%M:%S +0000}">'
+        f"{date:%B %d, %Y}</span></div>\n"
+        '<div class="breadcrumbs"><a href="/">Home</a> <a href="/posts/">Posts</a> '
+        f'<a href="/posts/{category.lower()}/">{category}</a></div>\n'
+        f'<div class="post-content">\n{content}\n</div>\n'
+        f'<ul class="post-tags">{tags}</ul>\n'
+        "</article>\n</body>\n</html>\n"
+    )
+    return Path(f"{date:%Y}") / f"{date:%m}" / fields["slug"] / "index.html", text
+
+
+def generate_corpus(root: Path, count: int, mode: ImportMode, seed: int = 0) -> Path:
+    """Write ``count`` synthetic posts under ``root``; an existing complete corpus is reused."""
+    marker = root / COMPLETE_MARKER
+    if marker.is_file() and marker.read_text(encoding="utf-8") == f"{mode.value} {count} {seed}":
+        return root
+
+    render = _hugo_document if mode == ImportMode.HUGO_BUILD else _markdown_document
+    rng = random.Random(seed)
+    for index in range(count):
+        relative, text = render(rng, index)
+        target = root / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(text, encoding="utf-8")
+    marker.write_text(f"{mode.value} {count} {seed}", encoding="utf-8")
+    return root
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import gzip
+import json
+import math
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+POST_PATH = re.compile(r"^/wp/v2/posts/(\d+)(/meta)?$")
+TERM_PATH = re.compile(r"^/wp/v2/(tags|categories)$")
+
+
+class FakeWordPress:
+    """In-memory WordPress REST API served on localhost, for benchmarks.
+
+    Implements just the routes md2wp uses: /users/me, posts, post meta, tags,
+    categories, media and /batch/v1. Use as a context manager; ``url`` is the value
+    for ``wordpress_url``.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self.posts: dict[int, dict[str, Any]] = {}
+        self.terms: dict[str, dict[str, int]] = {"tags": {}, "categories": {}}
+        self.media: dict[int, dict[str, Any]] = {}
+        self.requests = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _handler_for(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/wp-json/wp/v2"
+
+    def __enter__(self) -> FakeWordPress:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _new_id(self) -> int:
+        new_id = self._next_id
+        self._next_id += 1
+        return new_id
+
+    def handle(
+        self, method: str, path: str, query: dict[str, str], body: Any
+    ) -> tuple[int, Any, dict[str, str]]:
+        with self._lock:
+            self.requests += 1
+            if path == "/wp/v2/users/me":
+                return 200, {"id": 1, "name": "bench"}, {}
+            if path == "/wp/v2/media" and method == "POST":
+                media_id = self._new_id()
+                name = body["filename"]
+                self.media[media_id] = {
+                    "id": media_id,
+                    "source_url": f"https://example.com/wp-content/uploads/{media_id}/{name}",
+                    "size": len(body["data"]),
+                }
+                return 201, self.media[media_id], {}
+            if path == "/batch/v1" and method == "POST":
+                responses = []
+                for sub in body.get("requests", []):
+                    sub_path = sub["path"].split("?")[0]
+                    status, data, _ = self._route(sub["method"], sub_path, {}, sub.get("body"))
+                    responses.append({"status": status, "body": data})
+                return 207, {"responses": responses}, {}
+            return self._route(method, path, query, body)
+
+    def _route(
+        self, method: str, path: str, query: dict[str, str], body: Any
+    ) -> tuple[int, Any, dict[str, str]]:
+        if path == "/wp/v2/posts":
+            if method == "POST":
+                post_id = self._new_id()
+                self.posts[post_id] = {**body, "id": post_id, "meta": body.get("meta", {})}
+                return 201, self.posts[post_id], {}
+            items = list(self.posts.values())
+            if "slug" in query:
+                items = [item for item in items if item.get("slug") == query["slug"]]
+            return self._page(items, query)
+
+        match = POST_PATH.match(path)
+        if match:
+            post = self.posts.get(int(match.group(1)))
+            if post is None:
+                return 404, {"code": "rest_post_invalid_id"}, {}
+            if match.group(2):
+                post["meta"][body["key"]] = body["value"]
+                return 200, post["meta"], {}
+            if method in ("POST", "PUT"):
+                post.update(body)
+            return 200, post, {}
+
+        match = TERM_PATH.match(path)
+        if match:
+            terms = self.terms[match.group(1)]
+            if method == "POST":
+                name = body["name"]
+                if name in terms:
+                    return 400, {"code": "term_exists", "data": {"term_id": terms[name]}}, {}
+                terms[name] = self._new_id()
+                return 201, {"id": terms[name], "name": name}, {}
+            search = query.get("search", "").lower()
+            items = [
+                {"id": term_id, "name": name}
+                for name, term_id in terms.items()
+                if search in name.lower()
+            ]
+            return self._page(items, query)
+
+        return 404, {"code": "rest_no_route"}, {}
+
+    def _page(
+        self, items: list[dict[str, Any]], query: dict[str, str]
+    ) -> tuple[int, Any, dict[str, str]]:
+        per_page = int(query.get("per_page", 10))
+        page = int(query.get("page", 1))
+        total_pages = max(1, math.ceil(len(items) / per_page))
+        chunk = items[(page - 1) * per_page : page * per_page]
+        headers = {"X-WP-Total": str(len(items)), "X-WP-TotalPages": str(total_pages)}
+        return 200, chunk, headers
+
+
+def _handler_for(site: FakeWordPress) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def _dispatch(self) -> None:
+            parts = urlsplit(self.path)
+            path = parts.path.removeprefix("/wp-json")
+            query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+            raw = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            if self.headers.get("Content-Encoding") == "gzip":
+                raw = gzip.decompress(raw)
+            if path == "/wp/v2/media":
+                disposition = self.headers.get("Content-Disposition", "")
+                filename = disposition.partition("filename=")[2].strip('"') or "upload"
+                body = {"filename": filename, "data": raw}
+            else:
+                body = json.loads(raw) if raw else None
+
+            status, data, headers = site.handle(self.command, path, query, body)
+            payload = json.dumps(data).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        do_GET = do_POST = do_PUT = _dispatch
+
+    return Handler
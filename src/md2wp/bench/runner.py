@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import platform
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+from md2wp import __version__
+from md2wp.bench.corpus import generate_corpus
+from md2wp.bench.fake_wordpress import FakeWordPress
+from md2wp.config import ImportMode, Settings
+from md2wp.metrics import percentile
+from md2wp.models import ImportResult, Post
+from md2wp.parsers import front_matter
+from md2wp.parsers.hugo_build import discover_hugo_build_files
+from md2wp.parsers.markdown import discover_markdown_files
+from md2wp.pipeline import stream_posts
+from md2wp.sinks.wordpress import publish_to_wordpress
+from md2wp.sinks.wxr import write_wxr
+
+STAGES = ("discover", "front_matter", "parse", "export", "publish")
+
+
+def peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere.
+    scale = 1 if sys.platform == "darwin" else 1024
+    return round(peak * scale / 2**20, 1)
+
+
+def _gaps(items: Iterable[Post], latencies: list[float]) -> Iterator[Post]:
+    # The interval between consecutive posts passing through is the per-post
+    # latency of the slower side: the parser when draining a generator, the
+    # sink when it is fed from a list.
+    last = time.perf_counter()
+    for item in items:
+        now = time.perf_counter()
+        latencies.append(now - last)
+        last = now
+        yield item
+
+
+def _stage(count: int, seconds: float, latencies: list[float] | None = None) -> dict[str, Any]:
+    report: dict[str, Any] = {
+        "items": count,
+        "seconds": round(seconds, 4),
+        "posts_per_sec": round(count / seconds, 1) if seconds > 0 else None,
+    }
+    if latencies:
+        ordered = sorted(latencies)
+        report["p50_ms"] = round(percentile(ordered, 0.50) * 1000, 3)
+        report["p95_ms"] = round(percentile(ordered, 0.95) * 1000, 3)
+    return report
+
+
+def _front_matter_stage(paths: list[Path]) -> dict[str, Any]:
+    # Files are read up front so only metadata parsing is timed, here and for
+    # the python-frontmatter baseline (when installed).
+    texts = [path.read_text(encoding="utf-8") for path in paths]
+    start = time.perf_counter()
+    for text in texts:
+        front_matter.parse(text)
+    seconds = time.perf_counter() - start
+    report = _stage(len(texts), seconds)
+    report["yaml_loader"] = front_matter.YamlLoader.__name__
+    try:
+        import frontmatter
+    except ImportError:
+        return report
+    start = time.perf_counter()
+    for text in texts:
+        frontmatter.loads(text)
+    baseline = time.perf_counter() - start
+    report["baseline_seconds"] = round(baseline, 4)
+    report["speedup"] = round(baseline / seconds, 2) if seconds > 0 else None
+    return report
+
+
+def run_benchmark(
+    settings: Settings,
+    workdir: Path,
+    posts: int,
+    seed: int = 0,
+    stages: Iterable[str] = STAGES,
+) -> dict[str, Any]:
+    """Generate (or reuse) a synthetic corpus in ``workdir`` and time each stage on it."""
+    stages = set(stages)
+    corpus = workdir / f"corpus-{settings.mode.value}-{posts}"
+    source = generate_corpus(corpus, posts, settings.mode, seed)
+    settings = replace(
+        settings,
+        source=source,
+        domain=settings.domain or "https://example.com",
+        cache_dir=None,
+        state_path=None,
+        journal_path=None,
+        dry_run=False,
+    )
+    report: dict[str, Any] = {
+        "md2wp": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "mode": settings.mode.value,
+        "posts": posts,
+        "jobs": settings.jobs,
+        "concurrency": settings.concurrency,
+        "stages": {},
+    }
+
+    markdown = settings.mode == ImportMode.MARKDOWN
+    discover = discover_markdown_files if markdown else discover_hugo_build_files
+    if "discover" in stages:
+        start = time.perf_counter()
+        found = sum(1 for _ in discover(source, settings))
+        report["stages"]["discover"] = _stage(found, time.perf_counter() - start)
+
+    if "front_matter" in stages and markdown:
+        paths = list(discover(source, settings))
+        report["stages"]["front_matter"] = _front_matter_stage(paths)
+
+    result = ImportResult()
+    latencies: list[float] = []
+    start = time.perf_counter()
+    parsed = list(_gaps(stream_posts(settings, result), latencies))
+    if "parse" in stages:
+        report["stages"]["parse"] = _stage(len(parsed), time.perf_counter() - start, latencies)
+        report["stages"]["parse"]["errors"] = len(result.errors)
+
+    if "export" in stages:
+        latencies = []
+        start = time.perf_counter()
+        exported = write_wxr(_gaps(parsed, latencies), workdir / "bench-export.xml", settings)
+        report["stages"]["export"] = _stage(exported, time.perf_counter() - start, latencies)
+
+    if "publish" in stages:
+        latencies = []
+        with FakeWordPress() as site:
+            wp_settings = replace(
+                settings,
+                wordpress_url=site.url,
+                wordpress_username="bench",
+                wordpress_password="bench",
+            )
+            start = time.perf_counter()
+            published = publish_to_wordpress(_gaps(parsed, latencies), wp_settings)
+            seconds = time.perf_counter() - start
+        report["stages"]["publish"] = _stage(
+            published.published + published.updated, seconds, latencies
+        )
+        report["stages"]["publish"]["failed"] = published.failed
+        report["stages"]["publish"]["requests"] = site.requests
+
+    # ru_maxrss only ever grows within a process, so a per-stage reading would
+    # just be the high-water mark so far; report it once for the whole run.
+    report["peak_rss_mb"] = peak_rss_mb()
+    return report
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import logging
 import sys
 from enum import Enum
 from pathlib import Path
@@ -8,9 +9,9 @@ from typing import Annotated
 
 import typer
 
+from md2wp import metrics
 from md2wp.config import ImportMode, PostStatus, load_settings, settings_as_dict
 from md2wp.logging import setup_logging
-from md2wp.pipeline import run_export, run_import, run_validate
 
 app = typer.Typer(
     name="md2wp",
@@ -41,6 +42,15 @@ def _build_settings(
     include_drafts: bool | None,
     dry_run: bool,
     verbose: bool,
+    jobs: int | None,
+    cache: bool | None,
+    incremental: bool | None = None,
+    resume: bool | None = None,
+    media: bool | None = None,
+    concurrency: int | None = None,
+    streaming: bool | None = None,
+    max_items: int | None = None,
+    max_bytes: int | None = None,
 ):
     import_mode = None
     if mode == ModeOption.markdown:
@@ -61,6 +71,15 @@ def _build_settings(
         include_drafts=include_drafts,
         dry_run=dry_run,
         verbose=verbose,
+        jobs=jobs,
+        cache=cache,
+        incremental=incremental,
+        resume=resume,
+        media=media,
+        concurrency=concurrency,
+        streaming=streaming,
+        max_items=max_items,
+        max_bytes=max_bytes,
     )
 
 
@@ -90,6 +109,42 @@ def import_cmd(
     dry_run: Annotated[
         bool, typer.Option("--dry-run", help="Parse only, do not publish")
     ] = False,
+    jobs: Annotated[
+        int | None,
+        typer.Option("--jobs", "-j", min=0, help="Parser processes (0 = all CPUs)"),
+    ] = None,
+    cache: Annotated[
+        bool | None, typer.Option("--cache/--no-cache", help="Reuse cached parse results")
+    ] = None,
+    incremental: Annotated[
+        bool | None,
+        typer.Option(
+            "--incremental/--full", help="Skip posts unchanged since the last import"
+        ),
+    ] = None,
+    resume: Annotated[
+        bool,
+        typer.Option("--resume", help="Skip posts recorded in the journal of an interrupted run"),
+    ] = False,
+    concurrency: Annotated[
+        int | None,
+        typer.Option("--concurrency", min=1, help="Posts published in parallel"),
+    ] = None,
+    media: Annotated[
+        bool | None,
+        typer.Option("--media/--no-media", help="Upload local images and files to WordPress"),
+    ] = None,
+    streaming: Annotated[
+        bool | None,
+        typer.Option("--stream/--no-stream", help="Hand posts to the sink as they are parsed"),
+    ] = None,
+    metrics_out: Annotated[
+        Path | None,
+        typer.Option("--metrics-out", help="Write per-stage timings and HTTP stats as JSON"),
+    ] = None,
+    profile: Annotated[
+        bool, typer.Option("--profile", help="Run under cProfile and dump pstats")
+    ] = False,
     config: Annotated[
         Path | None, typer.Option("--config", "-c", help="Path to md2wp.toml")
     ] = None,
@@ -107,19 +162,29 @@ def import_cmd(
         include_drafts=include_drafts,
         dry_run=dry_run,
         verbose=verbose,
+        jobs=jobs,
+        cache=cache,
+        streaming=streaming,
+        incremental=incremental,
+        resume=resume,
+        media=media,
+        concurrency=concurrency,
     )
     setup_logging(settings.verbose)
 
+    from md2wp.pipeline import run_import
+
     try:
-        result = run_import(settings)
+        with metrics.collect(metrics_out, profile):
+            result = run_import(settings)
     except ValueError as exc:
         typer.echo(f"Error: {exc}", err=True)
         raise typer.Exit(code=1) from exc
 
     typer.echo(
         f"Done: {result.published} published, {result.updated} updated, "
-        f"{result.failed} failed, {len(result.errors)} parse errors, "
-        f"{len(result.skipped)} skipped"
+        f"{result.unchanged} unchanged, {result.resumed} resumed, {result.failed} failed, "
+        f"{len(result.errors)} parse errors, {len(result.skipped)} skipped"
     )
     raise typer.Exit(code=_exit_code(result))
 
@@ -150,6 +215,32 @@ def export_cmd(
     dry_run: Annotated[
         bool, typer.Option("--dry-run", help="Parse only, do not write WXR")
     ] = False,
+    jobs: Annotated[
+        int | None,
+        typer.Option("--jobs", "-j", min=0, help="Parser processes (0 = all CPUs)"),
+    ] = None,
+    cache: Annotated[
+        bool | None, typer.Option("--cache/--no-cache", help="Reuse cached parse results")
+    ] = None,
+    streaming: Annotated[
+        bool | None,
+        typer.Option("--stream/--no-stream", help="Hand posts to the sink as they are parsed"),
+    ] = None,
+    max_items: Annotated[
+        int | None,
+        typer.Option("--max-items", min=0, help="Split WXR output after N posts per file"),
+    ] = None,
+    max_bytes: Annotated[
+        int | None,
+        typer.Option("--max-bytes", min=0, help="Split WXR output at N bytes per file"),
+    ] = None,
+    metrics_out: Annotated[
+        Path | None,
+        typer.Option("--metrics-out", help="Write per-stage timings and HTTP stats as JSON"),
+    ] = None,
+    profile: Annotated[
+        bool, typer.Option("--profile", help="Run under cProfile and dump pstats")
+    ] = False,
     config: Annotated[
         Path | None, typer.Option("--config", "-c", help="Path to md2wp.toml")
     ] = None,
@@ -167,20 +258,28 @@ def export_cmd(
         include_drafts=include_drafts,
         dry_run=dry_run,
         verbose=verbose,
+        jobs=jobs,
+        cache=cache,
+        streaming=streaming,
+        max_items=max_items,
+        max_bytes=max_bytes,
     )
     setup_logging(settings.verbose)
 
+    from md2wp.pipeline import run_export
+
     try:
-        result = run_export(settings)
+        with metrics.collect(metrics_out, profile):
+            result = run_export(settings)
     except ValueError as exc:
         typer.echo(f"Error: {exc}", err=True)
         raise typer.Exit(code=1) from exc
 
     if result.export_path:
-        typer.echo(f"Exported to {result.export_path}")
+        typer.echo(f"Exported {result.exported} posts to {result.export_path}")
     else:
         typer.echo(
-            f"Validated {len(result.posts)} posts "
+            f"Validated {result.parsed} posts "
             f"({len(result.errors)} errors, {len(result.skipped)} skipped)"
         )
     raise typer.Exit(code=_exit_code(result))
@@ -200,6 +299,20 @@ def validate_cmd(
     include_drafts: Annotated[
         bool, typer.Option("--include-drafts", help="Include draft posts")
     ] = False,
+    jobs: Annotated[
+        int | None,
+        typer.Option("--jobs", "-j", min=0, help="Parser processes (0 = all CPUs)"),
+    ] = None,
+    cache: Annotated[
+        bool | None, typer.Option("--cache/--no-cache", help="Reuse cached parse results")
+    ] = None,
+    metrics_out: Annotated[
+        Path | None,
+        typer.Option("--metrics-out", help="Write per-stage timings and HTTP stats as JSON"),
+    ] = None,
+    profile: Annotated[
+        bool, typer.Option("--profile", help="Run under cProfile and dump pstats")
+    ] = False,
     config: Annotated[
         Path | None, typer.Option("--config", "-c", help="Path to md2wp.toml")
     ] = None,
@@ -217,11 +330,16 @@ def validate_cmd(
         include_drafts=include_drafts,
         dry_run=True,
         verbose=verbose,
+        jobs=jobs,
+        cache=cache,
     )
     setup_logging(settings.verbose)
 
+    from md2wp.pipeline import run_validate
+
     try:
-        result = run_validate(settings)
+        with metrics.collect(metrics_out, profile):
+            result = run_validate(settings)
     except ValueError as exc:
         typer.echo(f"Error: {exc}", err=True)
         raise typer.Exit(code=1) from exc
@@ -240,6 +358,71 @@ def validate_cmd(
     raise typer.Exit(code=_exit_code(result))
 
 
+@app.command("bench")
+def bench_cmd(
+    posts: Annotated[
+        int, typer.Option("--posts", "-n", min=1, help="Synthetic posts to generate")
+    ] = 1000,
+    mode: Annotated[
+        ModeOption, typer.Option("--mode", "-m", help="Corpus type")
+    ] = ModeOption.markdown,
+    workdir: Annotated[
+        Path | None,
+        typer.Option("--workdir", help="Keep the corpus here and reuse it (default: temp dir)"),
+    ] = None,
+    output: Annotated[
+        Path | None, typer.Option("--output", "-o", help="Write the JSON report here")
+    ] = None,
+    jobs: Annotated[
+        int | None,
+        typer.Option("--jobs", "-j", min=0, help="Parser processes (0 = all CPUs)"),
+    ] = None,
+    concurrency: Annotated[
+        int | None,
+        typer.Option("--concurrency", min=1, help="Posts published in parallel"),
+    ] = None,
+    seed: Annotated[int, typer.Option("--seed", help="Corpus random seed")] = 0,
+    config: Annotated[
+        Path | None, typer.Option("--config", "-c", help="Path to md2wp.toml")
+    ] = None,
+    verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Verbose logging")] = False,
+) -> None:
+    """Benchmark discovery, parsing, WXR export and publishing on a synthetic corpus."""
+    import tempfile
+
+    from md2wp.bench import run_benchmark
+
+    settings = _build_settings(
+        config=config,
+        mode=mode,
+        source=None,
+        output=None,
+        domain=None,
+        status=None,
+        recursive=None,
+        include_drafts=False,
+        dry_run=False,
+        verbose=verbose,
+        jobs=jobs,
+        cache=False,
+        concurrency=concurrency,
+    )
+    setup_logging(settings.verbose)
+    if not settings.verbose:
+        logging.getLogger("md2wp").setLevel(logging.WARNING)
+
+    if workdir:
+        report = run_benchmark(settings, workdir, posts, seed)
+    else:
+        with tempfile.TemporaryDirectory(prefix="md2wp-bench-") as tmp:
+            report = run_benchmark(settings, Path(tmp), posts, seed)
+
+    text = json.dumps(report, indent=2)
+    if output:
+        output.write_text(text + "\n", encoding="utf-8")
+    typer.echo(text)
+
+
 config_app = typer.Typer(help="Configuration commands.")
 app.add_typer(config_app, name="config")
 
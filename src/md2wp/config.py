@@ -34,6 +34,7 @@ class HugoBuildSelectors:
     categories_selector: str = "div.breadcrumbs a"
     category_breadcrumb_index: int = 2
     filter_year_dirs: bool = True
+    parser: str = "html.parser"
 
 
 @dataclass
@@ -47,11 +48,36 @@ class Settings:
     include_drafts: bool = False
     dry_run: bool = False
     verbose: bool = False
+    jobs: int = 1
+    scan_workers: int = 8
+    sort_paths: bool = True
+    cache_dir: Path | None = None
+    state_path: Path | None = None
+    journal_path: Path | None = None
+    resume: bool = False
+    incremental: bool = False
+    streaming: bool = False
+    max_items: int = 0
+    max_bytes: int = 0
     config_path: Path | None = None
 
     wordpress_url: str = ""
     wordpress_username: str = ""
     wordpress_password: str = ""
+    concurrency: int = 1
+    pool_size: int = 10
+    keep_alive: bool = True
+    compress_requests: bool = False
+    compress_min_bytes: int = 16384
+    prefetch_posts: bool = False
+    preload_terms: bool = False
+    batch: bool = False
+    meta_in_payload: bool = False
+    requests_per_second: float = 0.0
+    burst: int = 10
+    max_retries: int = 3
+    upload_media: bool = False
+    media_concurrency: int = 4
 
     site_title: str = "Imported Site"
     site_description: str = "Posts imported by md2wp"
@@ -59,6 +85,9 @@ class Settings:
 
     hugo_build: HugoBuildSelectors = field(default_factory=HugoBuildSelectors)
 
+    date_formats: list[str] = field(default_factory=list)
+
+    markdown_renderer: str = "python-markdown"
     markdown_extensions: list[str] = field(
         default_factory=lambda: ["fenced_code", "tables", "nl2br"]
     )
@@ -91,6 +120,15 @@ def load_settings(
     include_drafts: bool | None = None,
     dry_run: bool | None = None,
     verbose: bool | None = None,
+    jobs: int | None = None,
+    cache: bool | None = None,
+    streaming: bool | None = None,
+    max_items: int | None = None,
+    max_bytes: int | None = None,
+    incremental: bool | None = None,
+    concurrency: int | None = None,
+    resume: bool | None = None,
+    media: bool | None = None,
 ) -> Settings:
     load_dotenv()
 
@@ -106,6 +144,7 @@ def load_settings(
     imp = toml_data.get("import", {})
     site = toml_data.get("site", {})
     hb = toml_data.get("hugo_build", {})
+    md = toml_data.get("markdown", {})
 
     def pick(cli_val, toml_val, env_val, default):
         if cli_val is not None:
@@ -142,6 +181,11 @@ def load_settings(
         PostStatus.DRAFT.value,
     )
 
+    cache_enabled = pick(cache, imp.get("cache"), None, True)
+    cache_dir = Path(imp.get("cache_dir") or _env("MD2WP_CACHE_DIR", ".md2wp-cache"))
+    state_file = imp.get("state_file") or cache_dir / "sync-state.sqlite3"
+    journal_file = imp.get("journal_file") or cache_dir / "import-journal.jsonl"
+
     settings = Settings(
         mode=ImportMode(mode_str),
         source=Path(source_str).expanduser() if source_str else None,
@@ -156,6 +200,18 @@ def load_settings(
         include_drafts=pick(include_drafts, imp.get("include_drafts"), None, False),
         dry_run=pick(dry_run, imp.get("dry_run"), None, False),
         verbose=pick(verbose, imp.get("verbose"), None, False),
+        jobs=int(pick(jobs, imp.get("jobs"), _env("MD2WP_JOBS"), 1)),
+        scan_workers=int(imp.get("scan_workers", 8)),
+        sort_paths=imp.get("sort", True),
+        date_formats=list(imp.get("date_formats", [])),
+        cache_dir=cache_dir.expanduser() if cache_enabled else None,
+        state_path=Path(state_file).expanduser(),
+        journal_path=Path(journal_file).expanduser(),
+        resume=pick(resume, None, None, False),
+        incremental=pick(incremental, imp.get("incremental"), None, False),
+        streaming=pick(streaming, imp.get("streaming"), None, False),
+        max_items=int(pick(max_items, imp.get("max_items"), None, 0)),
+        max_bytes=int(pick(max_bytes, imp.get("max_bytes"), None, 0)),
         config_path=resolved_config,
         wordpress_url=pick(
             None,
@@ -175,6 +231,22 @@ def load_settings(
             _legacy_env("PASSWORD", "MD2WP_WORDPRESS_PASSWORD"),
             "",
         ),
+        concurrency=int(
+            pick(concurrency, wp.get("concurrency"), _env("MD2WP_CONCURRENCY"), 1)
+        ),
+        pool_size=int(wp.get("pool_size", 10)),
+        keep_alive=wp.get("keep_alive", True),
+        compress_requests=wp.get("compress_requests", False),
+        compress_min_bytes=int(wp.get("compress_min_bytes", 16384)),
+        prefetch_posts=wp.get("prefetch_posts", False),
+        preload_terms=wp.get("preload_terms", False),
+        batch=wp.get("batch", False),
+        meta_in_payload=wp.get("meta_in_payload", False),
+        requests_per_second=float(wp.get("requests_per_second", 0.0)),
+        burst=int(wp.get("burst", 10)),
+        max_retries=int(wp.get("max_retries", 3)),
+        upload_media=pick(media, wp.get("upload_media"), None, False),
+        media_concurrency=int(wp.get("media_concurrency", 4)),
         site_title=site.get("title", "Imported Site"),
         site_description=site.get("description", "Posts imported by md2wp"),
         site_language=site.get("language", "en"),
@@ -190,6 +262,11 @@ def load_settings(
                 "category_breadcrumb_index", HugoBuildSelectors.category_breadcrumb_index
             ),
             filter_year_dirs=hb.get("filter_year_dirs", True),
+            parser=hb.get("parser", HugoBuildSelectors.parser),
+        ),
+        markdown_renderer=md.get("renderer", "python-markdown"),
+        markdown_extensions=list(
+            md.get("extensions", ["fenced_code", "tables", "nl2br"])
         ),
     )
 
@@ -206,14 +283,43 @@ def settings_as_dict(settings: Settings) -> dict[str, Any]:
         "recursive": settings.recursive,
         "include_drafts": settings.include_drafts,
         "dry_run": settings.dry_run,
+        "jobs": settings.jobs,
+        "scan_workers": settings.scan_workers,
+        "sort": settings.sort_paths,
+        "date_formats": list(settings.date_formats),
+        "cache_dir": str(settings.cache_dir) if settings.cache_dir else None,
+        "state_path": str(settings.state_path) if settings.state_path else None,
+        "journal_path": str(settings.journal_path) if settings.journal_path else None,
+        "incremental": settings.incremental,
+        "streaming": settings.streaming,
+        "max_items": settings.max_items,
+        "max_bytes": settings.max_bytes,
         "config_path": str(settings.config_path) if settings.config_path else None,
         "wordpress_url": settings.wordpress_url or None,
         "wordpress_username": settings.wordpress_username or None,
         "wordpress_password": "***" if settings.wordpress_password else None,
+        "concurrency": settings.concurrency,
+        "pool_size": settings.pool_size,
+        "keep_alive": settings.keep_alive,
+        "compress_requests": settings.compress_requests,
+        "prefetch_posts": settings.prefetch_posts,
+        "preload_terms": settings.preload_terms,
+        "batch": settings.batch,
+        "meta_in_payload": settings.meta_in_payload,
+        "requests_per_second": settings.requests_per_second,
+        "burst": settings.burst,
+        "max_retries": settings.max_retries,
+        "upload_media": settings.upload_media,
+        "media_concurrency": settings.media_concurrency,
         "site_title": settings.site_title,
         "hugo_build": {
             "title_selector": settings.hugo_build.title_selector,
             "date_selector": settings.hugo_build.date_selector,
             "content_selector": settings.hugo_build.content_selector,
+            "parser": settings.hugo_build.parser,
+        },
+        "markdown": {
+            "renderer": settings.markdown_renderer,
+            "extensions": list(settings.markdown_extensions),
         },
     }
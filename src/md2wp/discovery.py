@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from md2wp import metrics
+from md2wp.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_SCAN_WORKERS = 8
+
+
+def _scan_dir(directory: Path) -> tuple[list[str], list[str]]:
+    files: list[str] = []
+    dirs: list[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.name)
+                    elif entry.is_file():
+                        files.append(entry.name)
+                except OSError:
+                    continue
+    except OSError as exc:
+        logger.warning("Cannot scan %s: %s", directory, exc)
+    return files, dirs
+
+
+def scan_files(
+    root: Path,
+    accept: Callable[[str], bool],
+    *,
+    recursive: bool = True,
+    keep_dir: Callable[[int, str], bool] | None = None,
+    workers: int = DEFAULT_SCAN_WORKERS,
+) -> Iterator[Path]:
+    """Yield files under ``root`` whose name passes ``accept``, as they are found.
+
+    Directories are listed concurrently with ``os.scandir`` on ``workers``
+    threads, so the order is arbitrary. ``keep_dir(depth, name)`` prunes
+    subdirectories while scanning (depth 0 is ``root`` itself).
+    """
+    pool = ThreadPoolExecutor(max_workers=max(1, workers))
+    pending: dict[Future, tuple[Path, int]] = {pool.submit(_scan_dir, root): (root, 0)}
+    try:
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                directory, depth = pending.pop(future)
+                files, dirs = future.result()
+                if recursive:
+                    for name in dirs:
+                        if keep_dir is None or keep_dir(depth, name):
+                            child = directory / name
+                            pending[pool.submit(_scan_dir, child)] = (child, depth + 1)
+                for name in files:
+                    if accept(name):
+                        yield directory / name
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def discover_files(
+    root: Path,
+    accept: Callable[[str], bool],
+    *,
+    recursive: bool = True,
+    keep_dir: Callable[[int, str], bool] | None = None,
+    workers: int = DEFAULT_SCAN_WORKERS,
+    sort: bool = True,
+) -> Iterator[Path]:
+    found = metrics.timed_iter(
+        "stage.discover",
+        scan_files(root, accept, recursive=recursive, keep_dir=keep_dir, workers=workers),
+    )
+    if sort:
+        return iter(sorted(found))
+    return found
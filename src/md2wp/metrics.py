@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import json
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, TypeVar
+
+from md2wp.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+Samples = dict[str, list[float]]
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+class Metrics:
+    """Timing samples for one run, keyed by name ("stage.parse", "post.publish", ...).
+
+    HTTP requests are keyed as ``http <METHOD> <endpoint> <status>`` with
+    numeric path segments folded to ``{id}``.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.samples: Samples = defaultdict(list)
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.samples[name].append(seconds)
+
+    def merge(self, samples: Samples) -> None:
+        with self._lock:
+            for name, values in samples.items():
+                self.samples[name].extend(values)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            samples = {name: list(values) for name, values in self.samples.items()}
+
+        timings: dict[str, Any] = {}
+        http: dict[str, dict[str, Any]] = {}
+        for name, values in sorted(samples.items()):
+            if name.startswith("http "):
+                _, method, endpoint, status = name.split(" ", 3)
+                http.setdefault(f"{method} {endpoint}", {})[status] = _summary(values)
+            else:
+                timings[name] = _summary(values)
+        retries = samples.get("http.retry_wait", [])
+        return {
+            "timings": timings,
+            "http": http,
+            "retries": {"count": len(retries), "wait_seconds": round(sum(retries), 4)},
+        }
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+def _summary(values: list[float]) -> dict[str, Any]:
+    ordered = sorted(values)
+    total = sum(ordered)
+    return {
+        "count": len(ordered),
+        "total_s": round(total, 6),
+        "mean_ms": round(total / len(ordered) * 1000, 3),
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+_metrics: Metrics | None = None
+_local = threading.local()
+
+
+def _sink() -> Metrics | None:
+    return getattr(_local, "capture", None) or _metrics
+
+
+def enabled() -> bool:
+    return _sink() is not None
+
+
+def timer(name: str) -> AbstractContextManager[None]:
+    sink = _sink()
+    return sink.timer(name) if sink else nullcontext()
+
+
+def observe(name: str, seconds: float) -> None:
+    sink = _sink()
+    if sink:
+        sink.observe(name, seconds)
+
+
+def observe_http(method: str, path: str, status: int | str, seconds: float) -> None:
+    sink = _sink()
+    if sink:
+        endpoint = _ID_SEGMENT.sub("/{id}", path.split("?", 1)[0])
+        sink.observe(f"http {method} {endpoint} {status}", seconds)
+
+
+def timed_iter(name: str, items: Iterable[T]) -> Iterator[T]:
+    """Yield from ``items``, recording the total time spent producing them as one sample."""
+    sink = _sink()
+    if sink is None:
+        yield from items
+        return
+    spent = 0.0
+    iterator = iter(items)
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                spent += time.perf_counter() - start
+                return
+            spent += time.perf_counter() - start
+            yield item
+    finally:
+        sink.observe(name, spent)
+
+
+@contextmanager
+def capture(active: bool) -> Iterator[Samples | None]:
+    """Collect this thread's samples separately, e.g. inside a parser worker process.
+
+    The caller ships the returned samples back and merges them into the run.
+    """
+    if not active:
+        yield None
+        return
+    local = Metrics()
+    previous = getattr(_local, "capture", None)
+    _local.capture = local
+    try:
+        yield local.samples
+    finally:
+        _local.capture = previous
+
+
+def merge(samples: Samples | None) -> None:
+    if samples and _metrics is not None:
+        _metrics.merge(samples)
+
+
+@contextmanager
+def collect(metrics_out: Path | None = None, profile: bool = False) -> Iterator[Metrics | None]:
+    """Record metrics for the enclosed run and write them out when it ends.
+
+    With ``profile``, the run also executes under cProfile; the stats are
+    dumped next to ``metrics_out`` (or to ``md2wp.pstats``) and the top
+    entries by cumulative time are printed to stderr.
+    """
+    global _metrics
+    if metrics_out is None and not profile:
+        yield None
+        return
+
+    _metrics = Metrics()
+    profiler = None
+    if profile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+    start = time.perf_counter()
+    try:
+        yield _metrics
+    finally:
+        if profiler:
+            profiler.disable()
+        _metrics.observe("run", time.perf_counter() - start)
+        report, _metrics = _metrics.to_dict(), None
+        if metrics_out:
+            metrics_out.parent.mkdir(parents=True, exist_ok=True)
+            metrics_out.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+            logger.info("Wrote metrics to %s", metrics_out)
+        if profiler:
+            _dump_profile(profiler, metrics_out)
+
+
+def _dump_profile(profiler: Any, metrics_out: Path | None) -> None:
+    import pstats
+
+    target = metrics_out.with_suffix(".pstats") if metrics_out else Path("md2wp.pstats")
+    profiler.dump_stats(target)
+    logger.info("Wrote profile to %s (inspect with python -m pstats)", target)
+    pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(25)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -28,6 +29,44 @@ class Post:
     html_content: str
 
 
+class LazyPost(Post):
+    """A Post whose ``html_content`` is produced by ``loader`` on first access.
+
+    Used when only the metadata is needed (validate, dry runs), so bodies are
+    never rendered unless something asks for them. ``loader`` must be
+    picklable (e.g. a ``functools.partial``) to cross worker processes.
+    """
+
+    def __init__(
+        self,
+        metadata: PostMetadata,
+        html_content: str | None = None,
+        *,
+        loader: Callable[[], str] | None = None,
+    ):
+        if html_content is None and loader is None:
+            raise TypeError("LazyPost needs html_content or a loader")
+        self.metadata = metadata
+        self._html_content = html_content
+        self._loader = loader
+
+    @property
+    def loaded(self) -> bool:
+        return self._html_content is not None
+
+    @property
+    def html_content(self) -> str:
+        if self._html_content is None:
+            self._html_content = self._loader()
+            self._loader = None
+        return self._html_content
+
+    @html_content.setter
+    def html_content(self, value: str) -> None:
+        self._html_content = value
+        self._loader = None
+
+
 @dataclass
 class ParseError:
     path: Path
@@ -39,8 +78,12 @@ class ImportResult:
     posts: list[Post] = field(default_factory=list)
     errors: list[ParseError] = field(default_factory=list)
     skipped: list[tuple[Path, str]] = field(default_factory=list)
+    parsed: int = 0
     published: int = 0
     updated: int = 0
+    unchanged: int = 0
+    resumed: int = 0
+    exported: int = 0
     failed: int = 0
     dry_run: bool = False
     export_path: Path | None = None
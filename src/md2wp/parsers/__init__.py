@@ -1,3 +1,26 @@
-from md2wp.parsers.markdown import discover_and_parse_markdown, parse_date, slug_from_url
+from __future__ import annotations
 
-__all__ = ["discover_and_parse_markdown", "parse_date", "slug_from_url"]
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from md2wp.parsers.dates import DateParser, parse_date
+    from md2wp.parsers.markdown import discover_and_parse_markdown
+    from md2wp.parsers.slugs import slug_from_url
+
+# Members are imported on first access, so Hugo mode does not load the
+# Markdown parser's dependencies and vice versa.
+_EXPORTS = {
+    "DateParser": "md2wp.parsers.dates",
+    "parse_date": "md2wp.parsers.dates",
+    "discover_and_parse_markdown": "md2wp.parsers.markdown",
+    "slug_from_url": "md2wp.parsers.slugs",
+}
+
+__all__ = ["DateParser", "discover_and_parse_markdown", "parse_date", "slug_from_url"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_EXPORTS[name]), name)
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Any
+
+from md2wp import __version__, metrics
+from md2wp.config import Settings
+from md2wp.logging import get_logger
+from md2wp.models import Post, PostMetadata
+from md2wp.pool import map_ordered
+
+logger = get_logger(__name__)
+
+CACHE_FORMAT = 2
+
+Outcome = tuple[Post | None, str | None]
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of the contents of ``path``, read in chunks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def settings_fingerprint(settings: Settings, source: Path) -> str:
+    data = {
+        "format": CACHE_FORMAT,
+        "version": __version__,
+        "mode": settings.mode.value,
+        "source": str(source.resolve()),
+        "include_drafts": settings.include_drafts,
+        "date_formats": list(settings.date_formats),
+        "markdown_renderer": settings.markdown_renderer,
+        "markdown_extensions": list(settings.markdown_extensions),
+        "hugo_build": asdict(settings.hugo_build),
+    }
+    encoded = json.dumps(data, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+# Front matter may carry dates, times and paths, which JSON has no type for.
+_TAGGED: dict[str, Callable[[str], Any]] = {
+    "$datetime": datetime.fromisoformat,
+    "$date": date.fromisoformat,
+    "$time": time.fromisoformat,
+    "$path": Path,
+}
+
+
+def _encode_value(value: Any) -> dict[str, str]:
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, time):
+        return {"$time": value.isoformat()}
+    if isinstance(value, Path):
+        return {"$path": str(value)}
+    raise TypeError(f"{type(value).__name__} is not cacheable")
+
+
+def _decode_value(data: dict[str, Any]) -> Any:
+    if len(data) == 1:
+        ((key, value),) = data.items()
+        if key in _TAGGED and isinstance(value, str):
+            return _TAGGED[key](value)
+    return data
+
+
+def _encode_outcome(outcome: Outcome) -> dict[str, Any]:
+    post, message = outcome
+    if post is None:
+        return {"post": None, "message": message}
+    data = {"metadata": asdict(post.metadata), "html_content": post.html_content}
+    return {"post": data, "message": message}
+
+
+def _decode_outcome(data: dict[str, Any]) -> Outcome:
+    post = data["post"]
+    if post is None:
+        return None, data["message"]
+    metadata = PostMetadata(**post["metadata"])
+    return Post(metadata=metadata, html_content=post["html_content"]), data["message"]
+
+
+@dataclass
+class _Entry:
+    fingerprint: str
+    mtime_ns: int
+    size: int
+    digest: str
+    outcome: Outcome
+
+
+class ParseCache:
+    def __init__(self, directory: Path, fingerprint: str):
+        self.directory = directory / "parse"
+        self.fingerprint = fingerprint
+        self._pending: dict[Path, tuple[int, int, str]] = {}
+
+    @classmethod
+    def for_settings(cls, settings: Settings, source: Path) -> ParseCache | None:
+        if settings.cache_dir is None:
+            return None
+        return cls(settings.cache_dir, settings_fingerprint(settings, source))
+
+    def _entry_path(self, path: Path) -> Path:
+        key = hashlib.sha256(str(path.resolve()).encode()).hexdigest()
+        return self.directory / key[:2] / f"{key[2:]}.json"
+
+    def _load(self, path: Path) -> _Entry | None:
+        try:
+            text = self._entry_path(path).read_text(encoding="utf-8")
+            data = json.loads(text, object_hook=_decode_value)
+            if data["fingerprint"] != self.fingerprint:
+                return None
+            return _Entry(
+                data["fingerprint"],
+                data["mtime_ns"],
+                data["size"],
+                data["digest"],
+                _decode_outcome(data["outcome"]),
+            )
+        except FileNotFoundError:
+            return None
+        except Exception as exc:  # corrupt or incompatible entry
+            logger.debug("Ignoring unreadable cache entry for %s: %s", path, exc)
+            return None
+
+    def _store(self, path: Path, entry: _Entry) -> None:
+        data = {
+            "fingerprint": entry.fingerprint,
+            "mtime_ns": entry.mtime_ns,
+            "size": entry.size,
+            "digest": entry.digest,
+            "outcome": _encode_outcome(entry.outcome),
+        }
+        target = self._entry_path(path)
+        tmp = target.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            text = json.dumps(data, ensure_ascii=False, default=_encode_value)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, target)
+        except (OSError, TypeError, ValueError) as exc:
+            logger.warning("Could not write parse cache entry for %s: %s", path, exc)
+
+    def get(self, path: Path) -> Outcome | None:
+        stat = path.stat()
+        entry = self._load(path)
+        if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            return entry.outcome
+
+        digest = file_digest(path)
+        if entry and entry.digest == digest:
+            # Touched but unchanged: refresh the stat key so the next run skips hashing.
+            entry.mtime_ns, entry.size = stat.st_mtime_ns, stat.st_size
+            self._store(path, entry)
+            return entry.outcome
+
+        self._pending[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return None
+
+    def put(self, path: Path, outcome: Outcome) -> None:
+        mtime_ns, size, digest = self._pending.pop(path)
+        self._store(path, _Entry(self.fingerprint, mtime_ns, size, digest, outcome))
+
+
+def _parse_through_cache(
+    path: Path, context: tuple[Callable[[Path, Any], Outcome], Any, ParseCache | None, bool]
+) -> tuple[Path, Outcome, metrics.Samples | None]:
+    func, extra, cache, collect = context
+    # Samples are captured per file and shipped back with the result, since
+    # worker processes cannot record into the parent's metrics.
+    with metrics.capture(collect) as samples:
+        with metrics.timer("post.parse"):
+            outcome = cache.get(path) if cache else None
+            if outcome is None:
+                outcome = func(path, extra)
+                if cache:
+                    cache.put(path, outcome)
+    return path, outcome, samples
+
+
+def parse_cached(
+    func: Callable[[Path, Any], Outcome],
+    paths: Iterable[Path],
+    extra: Any,
+    settings: Settings,
+    source: Path,
+    use_cache: bool = True,
+) -> Iterator[tuple[Path, Outcome]]:
+    """Lazily parse ``paths`` in order, consulting the parse cache first.
+
+    Cache lookups run alongside parsing (in the worker processes when
+    ``settings.jobs`` > 1), so results stream out as soon as they are ready.
+    """
+    cache = ParseCache.for_settings(settings, source) if use_cache else None
+    context = (func, extra, cache, metrics.enabled())
+    for path, outcome, samples in map_ordered(
+        _parse_through_cache, paths, context, settings.jobs
+    ):
+        metrics.merge(samples)
+        yield path, outcome
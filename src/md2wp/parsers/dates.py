@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import date, datetime
+from email.utils import parsedate_to_datetime
+from functools import cache, lru_cache
+from typing import Any
+
+DEFAULT_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+    "%b %d, %Y %I:%M %p %Z",
+    "%b %d, %Y %I:%M %p %z",
+)
+
+ISO_RE = re.compile(
+    r"\d{4}-?\d{2}-?\d{2}"
+    r"(?:[T ]\d{2}(?::?\d{2}(?::?\d{2}(?:[.,]\d+)?)?)?)?"
+    r"(?:Z|[+-]\d{2}(?::?\d{2})?)?"
+)
+RFC2822_RE = re.compile(
+    r"(?:[A-Za-z]{3},\s*)?\d{1,2}\s+[A-Za-z]{3}\s+\d{2,4}\s+\d{1,2}:\d{2}(?::\d{2})?"
+    r"(?:\s+(?:[+-]\d{4}|[A-Za-z]{1,5}))?"
+)
+
+# Shape of each strptime directive, used to rule a format out without calling strptime.
+DIRECTIVES = {
+    "a": r"[A-Za-z]+\.?",
+    "A": r"[A-Za-z]+",
+    "b": r"[A-Za-z]+\.?",
+    "B": r"[A-Za-z]+",
+    "d": r"\d{1,2}",
+    "f": r"\d{1,6}",
+    "H": r"\d{1,2}",
+    "I": r"\d{1,2}",
+    "j": r"\d{1,3}",
+    "m": r"\d{1,2}",
+    "M": r"\d{1,2}",
+    "p": r"[AaPp][Mm]",
+    "S": r"\d{1,2}",
+    "y": r"\d{2}",
+    "Y": r"\d{4}",
+    "z": r"(?:Z|[+-]\d{2}:?\d{2}(?::?\d{2})?)",
+    "Z": r"[A-Za-z]{1,5}",
+    "%": "%",
+}
+
+
+@dataclass(frozen=True)
+class DateFormat:
+    name: str
+    shape: re.Pattern[str]
+    parse: Callable[[str], datetime]
+
+    def sniff(self, text: str) -> datetime | None:
+        """Parse ``text`` if it has this format's shape, else return None."""
+        if not self.shape.fullmatch(text):
+            return None
+        try:
+            return self.parse(text)
+        except (TypeError, ValueError):
+            return None
+
+
+def _iso(text: str) -> datetime:
+    return datetime.fromisoformat(text.replace("Z", "+00:00"))
+
+
+def _shape(fmt: str) -> re.Pattern[str]:
+    parts = []
+    for literal, directive in re.findall(r"([^%]*)(?:%(.))?", fmt):
+        # strptime treats any run of whitespace in the format as \s+.
+        parts.append(r"\s+".join(re.escape(word) for word in re.split(r"\s+", literal)))
+        if directive:
+            parts.append(DIRECTIVES.get(directive, ".+?"))
+    return re.compile("".join(parts), re.IGNORECASE)
+
+
+def _strptime(fmt: str) -> DateFormat:
+    return DateFormat(fmt, _shape(fmt), lambda text: datetime.strptime(text, fmt))
+
+
+class DateParser:
+    """Parses post dates without exceptions on the common path.
+
+    Formats are ISO 8601, RFC 2822, then ``formats`` (strptime patterns),
+    then the built-in patterns, always in that order so a date parses the
+    same way wherever it appears. Each format is first checked against a
+    regex of its shape, so formats that cannot match are skipped without
+    raising. Dates matching no shape still get the lenient ``fromisoformat``
+    and email-date parsers. Repeated strings come straight from a cache.
+    """
+
+    def __init__(self, formats: Iterable[str] = (), cache_size: int = 4096):
+        extra = [fmt for fmt in formats if fmt not in DEFAULT_FORMATS]
+        self.formats = [
+            DateFormat("iso", ISO_RE, _iso),
+            DateFormat("rfc2822", RFC2822_RE, parsedate_to_datetime),
+            *(_strptime(fmt) for fmt in (*extra, *DEFAULT_FORMATS)),
+        ]
+        self._parse_text = lru_cache(maxsize=cache_size)(self._parse_uncached)
+
+    def _parse_uncached(self, text: str) -> datetime:
+        for fmt in self.formats:
+            parsed = fmt.sniff(text)
+            if parsed is not None:
+                return parsed
+        # Forms the shapes do not cover: ISO week dates, lowercase "t", a space
+        # before the offset, RFC 850, asctime, ...
+        for fallback in (_iso, parsedate_to_datetime):
+            try:
+                return fallback(text)
+            except (TypeError, ValueError):
+                continue
+        raise ValueError(f"Unsupported date format: {text!r}")
+
+    def parse(self, value: Any) -> datetime:
+        if isinstance(value, datetime):
+            return value
+        if value is None:
+            raise ValueError("Date is missing")
+        if isinstance(value, date):
+            return datetime(value.year, value.month, value.day)
+
+        text = str(value).strip()
+        if not text:
+            raise ValueError("Date is empty")
+        return self._parse_text(text)
+
+
+@cache
+def get_date_parser(formats: tuple[str, ...] = ()) -> DateParser:
+    """The shared DateParser for ``formats`` in this process."""
+    return DateParser(formats)
+
+
+def parse_date(value: Any, formats: Iterable[str] = ()) -> datetime:
+    return get_date_parser(tuple(formats)).parse(value)
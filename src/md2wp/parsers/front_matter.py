@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    import tomli as tomllib
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
+
+def _load_yaml(header: str) -> Any:
+    return yaml.load(header, Loader=YamlLoader)
+
+
+def _load_json(header: str) -> Any:
+    return json.loads("{" + header + "}")
+
+
+# Opening line -> (closing line, loader) for each front-matter style Hugo accepts.
+STYLES: dict[str, tuple[str, Callable[[str], Any]]] = {
+    "---": ("---", _load_yaml),
+    "+++": ("+++", tomllib.loads),
+    "{": ("}", _load_json),
+}
+_CLOSING = {
+    opening: re.compile(rf"^{re.escape(closing)}[ \t]*\r?$", re.MULTILINE)
+    for opening, (closing, _) in STYLES.items()
+}
+DECODE_ERRORS = (yaml.YAMLError, tomllib.TOMLDecodeError, json.JSONDecodeError)
+
+
+def parse(text: str) -> tuple[dict[str, Any], str]:
+    """Split ``text`` into its front-matter metadata and the stripped body.
+
+    Text without a complete front-matter block is all body. Raises ValueError
+    if the block does not parse.
+    """
+    text = text.lstrip("\ufeff").strip()
+    opening, _, rest = text.partition("\n")
+    opening = opening.strip()
+    if opening not in STYLES:
+        return {}, text
+    match = _CLOSING[opening].search(rest)
+    if match is None:
+        return {}, text
+
+    try:
+        data = STYLES[opening][1](rest[: match.start()])
+    except DECODE_ERRORS as exc:
+        raise ValueError(f"Invalid front matter: {exc}") from exc
+    return (data if isinstance(data, dict) else {}), rest[match.end() :].strip()
+
+
+def load(path: Path) -> tuple[dict[str, Any], str]:
+    """Read ``path`` and return its front-matter metadata and body."""
+    return parse(path.read_text(encoding="utf-8"))
+
+
+def read_header(path: Path) -> str:
+    """Return the front-matter block of ``path``, delimiters included.
+
+    Reading stops at the closing delimiter, so the body is never read. Files
+    without front matter give an empty string. Delimiters are found exactly as
+    :func:`parse` finds them, so the header parses to the same metadata.
+    """
+    with path.open(encoding="utf-8-sig") as f:
+        first = next((line for line in f if line.strip()), "")
+        opening = first.strip()
+        if opening not in STYLES:
+            return ""
+        lines = [first]
+        for line in f:
+            lines.append(line)
+            if _CLOSING[opening].match(line):
+                break
+    return "".join(lines)
+
+
+def load_header(path: Path) -> dict[str, Any]:
+    """Parse only the front matter of ``path`` into a metadata dict."""
+    return parse(read_header(path))[0]
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from md2wp.config import HugoBuildSelectors
+from md2wp.parsers.registry import Registry, load_backend
+
+
+@dataclass
+class HugoPage:
+    title: str | None = None
+    date: str | None = None
+    content_html: str | None = None
+    tags: list[str] = field(default_factory=list)
+    breadcrumbs: list[str] = field(default_factory=list)
+    lang: str | None = None
+
+
+@dataclass(frozen=True)
+class CompiledSelectors:
+    title: Any
+    date: Any
+    content: Any
+    tags: Any
+    breadcrumbs: Any
+    combined: Any
+
+
+@lru_cache(maxsize=8)
+def _compile(title: str, date: str, content: str, tags: str, breadcrumbs: str) -> CompiledSelectors:
+    import soupsieve
+
+    compiled = []
+    for selector in (title, date, content, tags, breadcrumbs):
+        try:
+            compiled.append(soupsieve.compile(selector))
+        except soupsieve.SelectorSyntaxError as exc:
+            raise ValueError(f"Invalid CSS selector {selector!r}: {exc}") from None
+    combined = soupsieve.compile(", ".join((title, date, content, tags, breadcrumbs, "html")))
+    return CompiledSelectors(*compiled, combined=combined)
+
+
+def compile_selectors(selectors: HugoBuildSelectors) -> CompiledSelectors:
+    """Compile the configured selectors once per process; later pages reuse them."""
+    return _compile(
+        selectors.title_selector,
+        selectors.date_selector,
+        selectors.content_selector,
+        selectors.tags_selector,
+        selectors.categories_selector,
+    )
+
+
+def _extract_soup(html: str, selectors: HugoBuildSelectors, features: str) -> HugoPage:
+    from bs4 import BeautifulSoup
+
+    compiled = compile_selectors(selectors)
+    soup = BeautifulSoup(html, features)
+    page = HugoPage()
+
+    # One walk over the union of all selectors, in document order; each hit is
+    # then classified against the individual selectors.
+    title_el = date_el = content_el = html_tag = None
+    for el in compiled.combined.iselect(soup):
+        if title_el is None and compiled.title.match(el):
+            title_el = el
+        if date_el is None and compiled.date.match(el):
+            date_el = el
+        if content_el is None and compiled.content.match(el):
+            content_el = el
+        if compiled.tags.match(el):
+            page.tags.append(el.get_text(strip=True))
+        if compiled.breadcrumbs.match(el):
+            page.breadcrumbs.append(el.get_text(strip=True))
+        if html_tag is None and el.name == "html":
+            html_tag = el
+
+    if title_el:
+        page.title = title_el.get_text(strip=True)
+    if date_el:
+        page.date = date_el.get("title") or date_el.get_text(strip=True)
+    if content_el:
+        page.content_html = str(content_el)
+    if html_tag and html_tag.get("lang"):
+        page.lang = html_tag["lang"]
+    return page
+
+
+def extract_html_parser(html: str, selectors: HugoBuildSelectors) -> HugoPage:
+    return _extract_soup(html, selectors, "html.parser")
+
+
+def extract_lxml(html: str, selectors: HugoBuildSelectors) -> HugoPage:
+    return _extract_soup(html, selectors, "lxml")
+
+
+def extract_selectolax(html: str, selectors: HugoBuildSelectors) -> HugoPage:
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(html)
+    page = HugoPage()
+
+    title_el = tree.css_first(selectors.title_selector)
+    if title_el:
+        page.title = title_el.text(strip=True)
+    date_el = tree.css_first(selectors.date_selector)
+    if date_el:
+        page.date = date_el.attributes.get("title") or date_el.text(strip=True)
+    content_el = tree.css_first(selectors.content_selector)
+    if content_el:
+        page.content_html = content_el.html
+
+    page.tags = [el.text(strip=True) for el in tree.css(selectors.tags_selector)]
+    page.breadcrumbs = [el.text(strip=True) for el in tree.css(selectors.categories_selector)]
+
+    html_tag = tree.css_first("html")
+    if html_tag and html_tag.attributes.get("lang"):
+        page.lang = html_tag.attributes["lang"]
+    return page
+
+
+BACKENDS: Registry[Callable[[str, HugoBuildSelectors], HugoPage]] = {
+    "html.parser": (extract_html_parser, "bs4"),
+    "lxml": (extract_lxml, "lxml"),
+    "selectolax": (extract_selectolax, "selectolax"),
+}
+
+
+def get_backend(name: str) -> Callable[[str, HugoBuildSelectors], HugoPage]:
+    return load_backend(BACKENDS, name, "hugo_build.parser")
+
+
+def prepare_backend(selectors: HugoBuildSelectors) -> Callable[[str, HugoBuildSelectors], HugoPage]:
+    """Resolve the backend and validate its selectors before any page is parsed."""
+    extract = get_backend(selectors.parser)
+    if extract is not extract_selectolax:
+        compile_selectors(selectors)
+    return extract
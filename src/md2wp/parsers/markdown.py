@@ -1,69 +1,23 @@
 from __future__ import annotations
 
-import re
-from datetime import datetime
-from email.utils import parsedate_to_datetime
+from collections.abc import Iterator
+from functools import partial
 from pathlib import Path
 from typing import Any
 
-import frontmatter
-import markdown
-
+from md2wp import metrics
 from md2wp.config import Settings
+from md2wp.discovery import discover_files
 from md2wp.logging import get_logger
-from md2wp.models import ParseError, Post, PostMetadata
+from md2wp.models import LazyPost, ParseError, Post, PostMetadata
+from md2wp.parsers import front_matter
+from md2wp.parsers.cache import parse_cached
+from md2wp.parsers.dates import get_date_parser, parse_date  # noqa: F401 (re-exported)
+from md2wp.parsers.renderers import get_renderer
+from md2wp.parsers.slugs import LANG_SUFFIX_RE, slug_from_path, slug_from_url
 
 logger = get_logger(__name__)
 
-LANG_SUFFIX_RE = re.compile(r"\.([a-z]{2})\.md$", re.IGNORECASE)
-
-
-def slug_from_url(url: str) -> str:
-    parts = url.strip("/").split("/")
-    return parts[-1] if parts else ""
-
-
-def slug_from_path(path: Path) -> str:
-    name = path.stem
-    match = LANG_SUFFIX_RE.search(path.name)
-    if match:
-        name = name[: -(len(match.group(1)) + 1)]
-    return name
-
-
-def parse_date(value: Any) -> datetime:
-    if isinstance(value, datetime):
-        return value
-    if value is None:
-        raise ValueError("Date is missing")
-
-    text = str(value).strip()
-    if not text:
-        raise ValueError("Date is empty")
-
-    try:
-        return datetime.fromisoformat(text.replace("Z", "+00:00"))
-    except ValueError:
-        pass
-
-    try:
-        return parsedate_to_datetime(text)
-    except (TypeError, ValueError):
-        pass
-
-    for fmt in (
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d",
-        "%b %d, %Y %I:%M %p %Z",
-        "%b %d, %Y %I:%M %p %z",
-    ):
-        try:
-            return datetime.strptime(text, fmt)
-        except ValueError:
-            continue
-
-    raise ValueError(f"Unsupported date format: {text!r}")
-
 
 def detect_lang(path: Path, metadata: dict[str, Any]) -> str:
     if metadata.get("lang"):
@@ -74,24 +28,58 @@ def detect_lang(path: Path, metadata: dict[str, Any]) -> str:
     return "en"
 
 
-def should_skip_file(path: Path, metadata: dict[str, Any], settings: Settings) -> str | None:
-    if path.name == "_index.md":
+def _name_skip_reason(name: str) -> str | None:
+    if name == "_index.md":
         return "index file"
-    if path.name.startswith("."):
+    if name.startswith("."):
         return "hidden file"
+    return None
+
+
+def should_skip_file(path: Path, metadata: dict[str, Any], settings: Settings) -> str | None:
+    reason = _name_skip_reason(path.name)
+    if reason:
+        return reason
     if metadata.get("draft") and not settings.include_drafts:
         return "draft"
     return None
 
 
-def discover_markdown_files(source: Path, recursive: bool) -> list[Path]:
-    pattern = "**/*.md" if recursive else "*.md"
-    return sorted(source.glob(pattern))
+def discover_markdown_files(source: Path, settings: Settings) -> Iterator[Path]:
+    return discover_files(
+        source,
+        lambda name: name.endswith(".md"),
+        recursive=settings.recursive,
+        workers=settings.scan_workers,
+        sort=settings.sort_paths,
+    )
+
+
+def _render_body(path: Path, body: str, settings: Settings) -> str:
+    with metrics.timer("parse.render"):
+        render = get_renderer(settings.markdown_renderer, settings.markdown_extensions)
+        html_content = render(body)
+    if not html_content.strip():
+        logger.warning("Empty content body in %s", path)
+    return html_content
+
+
+def render_markdown_file(path: Path, settings: Settings) -> str:
+    """Read ``path`` in full and render its body to HTML."""
+    return _render_body(path, front_matter.load(path)[1], settings)
 
 
-def parse_markdown_file(path: Path, settings: Settings) -> Post | None:
-    post = frontmatter.load(path)
-    metadata = dict(post.metadata)
+def parse_markdown_file(path: Path, settings: Settings, lazy: bool = False) -> Post | None:
+    """Parse ``path`` into a Post.
+
+    With ``lazy``, only the front matter is read; the body is rendered on first
+    access to ``html_content`` (see LazyPost).
+    """
+    with metrics.timer("parse.front_matter"):
+        if lazy:
+            metadata, body = front_matter.load_header(path), None
+        else:
+            metadata, body = front_matter.load(path)
     skip_reason = should_skip_file(path, metadata, settings)
     if skip_reason:
         raise ValueError(skip_reason)
@@ -114,63 +102,79 @@ def parse_markdown_file(path: Path, settings: Settings) -> Post | None:
     if isinstance(categories, str):
         categories = [categories]
 
-    html_content = markdown.markdown(
-        post.content,
-        extensions=settings.markdown_extensions,
+    post_metadata = PostMetadata(
+        title=str(title),
+        date=get_date_parser(tuple(settings.date_formats)).parse(date_raw),
+        slug=str(slug),
+        url=url,
+        tags=[str(t) for t in tags],
+        categories=[str(c) for c in categories],
+        lang=detect_lang(path, metadata),
+        excerpt=str(metadata.get("excerpt", "")),
+        shortlink=str(metadata.get("shortlink", "")),
+        draft=bool(metadata.get("draft", False)),
+        source_path=path,
+        extra={
+            k: v
+            for k, v in metadata.items()
+            if k
+            not in {
+                "title",
+                "date",
+                "slug",
+                "url",
+                "tags",
+                "categories",
+                "lang",
+                "excerpt",
+                "shortlink",
+                "draft",
+            }
+        },
     )
+    if body is None:
+        return LazyPost(post_metadata, loader=partial(render_markdown_file, path, settings))
+    return Post(metadata=post_metadata, html_content=_render_body(path, body, settings))
 
-    if not html_content.strip():
-        logger.warning("Empty content body in %s", path)
 
-    return Post(
-        metadata=PostMetadata(
-            title=str(title),
-            date=parse_date(date_raw),
-            slug=str(slug),
-            url=url,
-            tags=[str(t) for t in tags],
-            categories=[str(c) for c in categories],
-            lang=detect_lang(path, metadata),
-            excerpt=str(metadata.get("excerpt", "")),
-            shortlink=str(metadata.get("shortlink", "")),
-            draft=bool(metadata.get("draft", False)),
-            source_path=path,
-            extra={
-                k: v
-                for k, v in metadata.items()
-                if k
-                not in {
-                    "title",
-                    "date",
-                    "slug",
-                    "url",
-                    "tags",
-                    "categories",
-                    "lang",
-                    "excerpt",
-                    "shortlink",
-                    "draft",
-                }
-            },
-        ),
-        html_content=html_content,
-    )
-
-
-def discover_and_parse_markdown(
-    source: Path, settings: Settings
-) -> tuple[list[Post], list[ParseError], list[tuple[Path, str]]]:
-    posts: list[Post] = []
-    errors: list[ParseError] = []
-    skipped: list[tuple[Path, str]] = []
-
-    for path in discover_markdown_files(source, settings.recursive):
-        try:
-            post = parse_markdown_file(path, settings)
-            if post:
-                posts.append(post)
-        except ValueError as exc:
-            message = str(exc)
+def _parse_markdown_path(
+    path: Path, context: tuple[Settings, bool]
+) -> tuple[Post | None, str | None]:
+    settings, lazy = context
+    try:
+        return parse_markdown_file(path, settings, lazy), None
+    except ValueError as exc:
+        return None, str(exc)
+
+
+def iter_markdown_posts(
+    source: Path,
+    settings: Settings,
+    errors: list[ParseError],
+    skipped: list[tuple[Path, str]],
+) -> Iterator[Post]:
+    def parseable(paths: Iterator[Path]) -> Iterator[Path]:
+        # Name-based skips are decided during discovery, without reading the file.
+        for path in paths:
+            reason = _name_skip_reason(path.name)
+            if reason:
+                skipped.append((path, reason))
+                logger.debug("Skipped %s (%s)", path, reason)
+            else:
+                yield path
+
+    # Fail on a bad [markdown] renderer before any worker starts.
+    get_renderer(settings.markdown_renderer, settings.markdown_extensions)
+    # Dry runs and validate only need metadata: read front matter alone and
+    # leave bodies unrendered. Such posts are not worth caching.
+    lazy = settings.dry_run
+    paths = parseable(discover_markdown_files(source, settings))
+    for path, (post, message) in parse_cached(
+        _parse_markdown_path, paths, (settings, lazy), settings, source, use_cache=not lazy
+    ):
+        if post:
+            yield post
+        elif message is not None:
             if message in {"index file", "hidden file", "draft"}:
                 skipped.append((path, message))
                 logger.debug("Skipped %s (%s)", path, message)
@@ -178,4 +182,11 @@ def discover_and_parse_markdown(
                 errors.append(ParseError(path=path, message=message))
                 logger.error("Failed to parse %s: %s", path, message)
 
+
+def discover_and_parse_markdown(
+    source: Path, settings: Settings
+) -> tuple[list[Post], list[ParseError], list[tuple[Path, str]]]:
+    errors: list[ParseError] = []
+    skipped: list[tuple[Path, str]] = []
+    posts = list(iter_markdown_posts(source, settings, errors, skipped))
     return posts, errors, skipped
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import importlib
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# name -> (implementation, module it needs). Optional modules come from the
+# ``fast`` extra.
+Registry = dict[str, tuple[T, str]]
+
+
+def load_backend(registry: Registry[T], name: str, setting: str) -> T:
+    """Return the implementation registered as ``name`` once its module imports.
+
+    ``setting`` names the config key in error messages. Raises ValueError for
+    an unknown name or a missing package.
+    """
+    try:
+        implementation, module = registry[name]
+    except KeyError:
+        choices = ", ".join(registry)
+        raise ValueError(f"Unknown {setting} {name!r} (choose from {choices})") from None
+
+    try:
+        importlib.import_module(module)
+    except ImportError as exc:
+        raise ValueError(
+            f"{setting} = {name!r} requires the {module!r} package "
+            f"(pip install 'md2wp[fast]')"
+        ) from exc
+    return implementation
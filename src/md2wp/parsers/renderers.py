@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Sequence
+
+from md2wp.parsers.registry import Registry, load_backend
+
+Renderer = Callable[[str], str]
+
+# Python-Markdown extensions the CommonMark backends can reproduce, and how.
+MARKDOWN_IT_EXTENSIONS = {"fenced_code": None, "tables": "table", "nl2br": "breaks"}
+MISTUNE_EXTENSIONS = {"fenced_code": None, "tables": "table", "nl2br": "hard_wrap"}
+
+
+def _unsupported(name: str, supported: dict[str, str | None], extensions: Sequence[str]) -> None:
+    missing = [ext for ext in extensions if ext not in supported]
+    if missing:
+        raise ValueError(
+            f"markdown.renderer = {name!r} does not support the Markdown extensions "
+            f"{', '.join(missing)} (supported: {', '.join(supported)})"
+        )
+
+
+def build_python_markdown(extensions: Sequence[str]) -> Renderer:
+    import markdown
+
+    md = markdown.Markdown(extensions=list(extensions))
+
+    def render(text: str) -> str:
+        return md.reset().convert(text)
+
+    return render
+
+
+def build_markdown_it(extensions: Sequence[str]) -> Renderer:
+    from markdown_it import MarkdownIt
+
+    _unsupported("markdown-it", MARKDOWN_IT_EXTENSIONS, extensions)
+    md = MarkdownIt("commonmark", {"breaks": "nl2br" in extensions})
+    if "tables" in extensions:
+        md.enable("table")
+    return md.render
+
+
+def build_mistune(extensions: Sequence[str]) -> Renderer:
+    import mistune
+
+    _unsupported("mistune", MISTUNE_EXTENSIONS, extensions)
+    plugins = ["table"] if "tables" in extensions else []
+    return mistune.create_markdown(
+        escape=False, hard_wrap="nl2br" in extensions, plugins=plugins
+    )
+
+
+RENDERERS: Registry[Callable[[Sequence[str]], Renderer]] = {
+    "python-markdown": (build_python_markdown, "markdown"),
+    "markdown-it": (build_markdown_it, "markdown_it"),
+    "mistune": (build_mistune, "mistune"),
+}
+
+_local = threading.local()
+
+
+def get_renderer(name: str, extensions: Sequence[str]) -> Renderer:
+    """Return this thread's renderer for ``name``, building it on first use.
+
+    Each worker process (or thread) keeps one instance per configuration, so
+    extensions are loaded once rather than for every document.
+    """
+    cache: dict[tuple[str, tuple[str, ...]], Renderer] = _local.__dict__.setdefault("cache", {})
+    key = (name, tuple(extensions))
+    if key in cache:
+        return cache[key]
+
+    build = load_backend(RENDERERS, name, "markdown.renderer")
+    cache[key] = build(extensions)
+    return cache[key]
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+LANG_SUFFIX_RE = re.compile(r"\.([a-z]{2})\.md$", re.IGNORECASE)
+
+
+def slug_from_url(url: str) -> str:
+    parts = url.strip("/").split("/")
+    return parts[-1] if parts else ""
+
+
+def slug_from_path(path: Path) -> str:
+    name = path.stem
+    match = LANG_SUFFIX_RE.search(path.name)
+    if match:
+        name = name[: -(len(match.group(1)) + 1)]
+    return name
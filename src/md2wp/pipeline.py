@@ -1,12 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+
+from md2wp import metrics
 from md2wp.config import ImportMode, Settings
 from md2wp.logging import get_logger
-from md2wp.models import ImportResult
-from md2wp.parsers.hugo_build import discover_and_parse_hugo_build
-from md2wp.parsers.markdown import discover_and_parse_markdown
-from md2wp.sinks.wordpress import publish_to_wordpress
-from md2wp.sinks.wxr import export_to_wxr
+from md2wp.models import ImportResult, Post
 
 logger = get_logger(__name__)
 
@@ -18,64 +17,99 @@ def _ensure_source(settings: Settings) -> None:
         raise ValueError(f"Source directory does not exist: {settings.source}")
 
 
-def discover_and_parse(settings: Settings) -> ImportResult:
+def _counted(posts: Iterator[Post], result: ImportResult) -> Iterator[Post]:
+    for post in posts:
+        result.parsed += 1
+        yield post
+
+    logger.info(
+        "Discovered %d posts (%d errors, %d skipped)",
+        result.parsed,
+        len(result.errors),
+        len(result.skipped),
+    )
+
+
+def stream_posts(settings: Settings, result: ImportResult) -> Iterator[Post]:
+    """Yield posts as they are parsed, recording errors and skips on ``result``."""
     _ensure_source(settings)
 
+    # Parsers and sinks are imported where they are used, so a run only loads
+    # the dependencies of its own mode and sink.
     if settings.mode == ImportMode.HUGO_BUILD:
-        posts, errors, skipped = discover_and_parse_hugo_build(settings.source, settings)
+        from md2wp.parsers.hugo_build import iter_hugo_build_posts
+
+        posts = iter_hugo_build_posts(settings.source, settings, result.errors, result.skipped)
     else:
-        posts, errors, skipped = discover_and_parse_markdown(settings.source, settings)
+        from md2wp.parsers.markdown import iter_markdown_posts
 
-    logger.info(
-        "Discovered %d posts (%d errors, %d skipped)",
-        len(posts),
-        len(errors),
-        len(skipped),
-    )
+        posts = iter_markdown_posts(settings.source, settings, result.errors, result.skipped)
+    return _counted(metrics.timed_iter("stage.parse", posts), result)
 
-    return ImportResult(posts=posts, errors=errors, skipped=skipped, dry_run=settings.dry_run)
 
+def discover_and_parse(settings: Settings) -> ImportResult:
+    result = ImportResult(dry_run=settings.dry_run)
+    result.posts = list(stream_posts(settings, result))
+    return result
 
-def run_import(settings: Settings) -> ImportResult:
+
+def _source_posts(settings: Settings) -> tuple[ImportResult, Iterator[Post] | list[Post]]:
+    if settings.streaming:
+        result = ImportResult(dry_run=settings.dry_run)
+        return result, stream_posts(settings, result)
     result = discover_and_parse(settings)
+    return result, result.posts
+
+
+def _merge(sink_result: ImportResult, result: ImportResult) -> ImportResult:
+    sink_result.posts = result.posts
+    sink_result.errors = result.errors
+    sink_result.skipped = result.skipped
+    sink_result.parsed = result.parsed
+    return sink_result
+
+
+def run_import(settings: Settings) -> ImportResult:
+    result, posts = _source_posts(settings)
 
     if settings.dry_run:
-        logger.info("Dry run: would process %d posts", len(result.posts))
-        for post in result.posts:
+        for post in posts:
             logger.info(
                 "  - %s (%s, slug=%s)",
                 post.metadata.title,
                 post.metadata.date.date(),
                 post.metadata.slug,
             )
+        logger.info("Dry run: would process %d posts", result.parsed)
         return result
 
-    if not result.posts:
+    if not settings.streaming and not result.posts:
         logger.warning("No posts to import")
         return result
 
-    publish_result = publish_to_wordpress(result.posts, settings)
-    publish_result.errors = result.errors
-    publish_result.skipped = result.skipped
-    return publish_result
+    from md2wp.sinks.wordpress import publish_to_wordpress
+
+    with metrics.timer("stage.publish"):
+        return _merge(publish_to_wordpress(posts, settings), result)
 
 
 def run_export(settings: Settings) -> ImportResult:
-    result = discover_and_parse(settings)
+    result, posts = _source_posts(settings)
 
     if settings.dry_run:
-        logger.info("Dry run: would export %d posts", len(result.posts))
+        for _ in posts:
+            pass
+        logger.info("Dry run: would export %d posts", result.parsed)
         return result
 
-    if not result.posts:
+    if not settings.streaming and not result.posts:
         logger.warning("No posts to export")
-        result.errors = result.errors
         return result
 
-    export_result = export_to_wxr(result.posts, settings)
-    export_result.errors = result.errors
-    export_result.skipped = result.skipped
-    return export_result
+    from md2wp.sinks.wxr import export_to_wxr
+
+    with metrics.timer("stage.export"):
+        return _merge(export_to_wxr(posts, settings), result)
 
 
 def run_validate(settings: Settings) -> ImportResult:
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def resolve_jobs(jobs: int) -> int:
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def _mp_context() -> multiprocessing.context.BaseContext:
+    # Workers start while other threads may still be running (the scandir
+    # pool streaming unsorted paths, publish threads), and forking a threaded
+    # process can deadlock the child. Start them from a clean forkserver.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def map_ordered(
+    func: Callable[[T, Any], R], items: Iterable[T], extra: Any, jobs: int
+) -> Iterator[R]:
+    """Lazily apply ``func(item, extra)`` to every item, preserving input order.
+
+    Runs in-process when ``jobs`` is 1, otherwise spreads the work across a
+    process pool with a bounded number of items in flight, so results can be
+    consumed as they arrive. ``func`` and ``extra`` must be picklable.
+    """
+    workers = resolve_jobs(jobs)
+    if workers <= 1:
+        for item in items:
+            yield func(item, extra)
+        return
+
+    window = workers * 4
+    pending: deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_mp_context()) as executor:
+        for item in items:
+            pending.append(executor.submit(func, item, extra))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
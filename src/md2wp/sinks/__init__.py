@@ -1,4 +1,24 @@
-from md2wp.sinks.wordpress import WordPressClient, publish_to_wordpress
-from md2wp.sinks.wxr import export_to_wxr
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from md2wp.sinks.wordpress import WordPressClient, publish_to_wordpress
+    from md2wp.sinks.wxr import export_to_wxr
+
+# Members are imported on first access, so importing one sink does not load
+# the others (and ``requests`` is only loaded for WordPress).
+_EXPORTS = {
+    "WordPressClient": "md2wp.sinks.wordpress",
+    "publish_to_wordpress": "md2wp.sinks.wordpress",
+    "export_to_wxr": "md2wp.sinks.wxr",
+}
 
 __all__ = ["WordPressClient", "publish_to_wordpress", "export_to_wxr"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_EXPORTS[name]), name)
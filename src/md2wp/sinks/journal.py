@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+from md2wp.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class Journal:
+    """Append-only JSON-lines record of posts published during an import.
+
+    One line per completed publish (site, slug, post ID, action). Lines are
+    flushed immediately but fsynced only every ``sync_every`` records or
+    ``sync_interval`` seconds, so a crash loses at most the last batch; those
+    posts are simply published again on resume.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        site: str,
+        resume: bool = False,
+        sync_every: int = 100,
+        sync_interval: float = 1.0,
+    ):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.site = site
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.completed: dict[str, tuple[int, str]] = self._load() if resume else {}
+        self._file = path.open("a" if resume else "w", encoding="utf-8")
+        self._unsynced = 0
+        self._synced_at = time.monotonic()
+
+    def _load(self) -> dict[str, tuple[int, str]]:
+        completed: dict[str, tuple[int, str]] = {}
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:  # torn write from a crash
+                        continue
+                    if entry.get("site") == self.site:
+                        completed[entry["slug"]] = (entry["post_id"], entry["action"])
+        except FileNotFoundError:
+            pass
+        if completed:
+            logger.info("Resuming: %d posts already published per %s", len(completed), self.path)
+        return completed
+
+    def record(self, slug: str, post_id: int, action: str) -> None:
+        entry = {"site": self.site, "slug": slug, "post_id": post_id, "action": action}
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self.completed[slug] = (post_id, action)
+        self._unsynced += 1
+        if (
+            self._unsynced >= self.sync_every
+            or time.monotonic() - self._synced_at >= self.sync_interval
+        ):
+            self.sync()
+
+    def sync(self) -> None:
+        if self._unsynced:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+        self._synced_at = time.monotonic()
+
+    def finish(self) -> None:
+        """Empty and close the journal once every post is published.
+
+        A later ``--resume`` then has nothing to skip.
+        """
+        self._file.truncate(0)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self.completed.clear()
+        self._file.close()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self.sync()
+        self._file.close()
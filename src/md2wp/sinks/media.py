@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import re
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import unquote, urlsplit
+
+from md2wp import metrics
+from md2wp.logging import get_logger
+from md2wp.models import Post
+from md2wp.parsers.cache import file_digest
+
+if TYPE_CHECKING:
+    from md2wp.sinks.wordpress import WordPressClient
+
+logger = get_logger(__name__)
+
+# Only media elements count: <img>/<video>/<audio>/<source src> and <a href>
+# to a media file. <script>, <iframe> and friends are left alone.
+MEDIA_TAG = re.compile(r"<(?P<tag>img|video|audio|source|a)\b[^>]*>", re.IGNORECASE)
+ASSET_ATTRIBUTE = re.compile(
+    r"""(?<![\w-])(?P<attr>src|href)=(?P<quote>["'])(?P<url>[^"'<>]*)(?P=quote)"""
+)
+LINKED_MEDIA = {
+    ".avif", ".gif", ".jpeg", ".jpg", ".mp3", ".mp4", ".pdf", ".png", ".svg", ".webm",
+    ".webp", ".zip",
+}
+
+
+def _local_path(url: str) -> str | None:
+    if not url or url.startswith(("#", "//", "data:")):
+        return None
+    parts = urlsplit(url)
+    if parts.scheme or parts.netloc or not parts.path:
+        return None
+    return unquote(parts.path)
+
+
+def _asset_url(tag: str, attribute: re.Match) -> str | None:
+    url = attribute.group("url")
+    path = _local_path(url)
+    if path is None:
+        return None
+    if tag == "a":
+        if attribute.group("attr") != "href" or Path(path).suffix.lower() not in LINKED_MEDIA:
+            return None
+    elif attribute.group("attr") != "src":
+        return None
+    return url
+
+
+def _asset_urls(html: str) -> Iterator[str]:
+    for element in MEDIA_TAG.finditer(html):
+        tag = element.group("tag").lower()
+        for attribute in ASSET_ATTRIBUTE.finditer(element.group(0)):
+            url = _asset_url(tag, attribute)
+            if url is not None:
+                yield url
+
+
+def find_local_assets(html: str) -> list[str]:
+    """Local media references (``src`` of media elements, ``href`` to media files)."""
+    found: list[str] = []
+    for url in _asset_urls(html):
+        if url not in found:
+            found.append(url)
+    return found
+
+
+class MediaUploader:
+    """Uploads the local files a post references and points the post at the uploads.
+
+    Files are keyed by SHA-256, so the same content is uploaded once per site:
+    within a run through an in-memory index, across runs through SyncState.
+    """
+
+    def __init__(self, client: WordPressClient, source_root: Path | None, workers: int = 4):
+        self.client = client
+        self.source_root = source_root
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, workers), thread_name_prefix="md2wp-media"
+        )
+        self._uploaded: dict[str, tuple[int, str]] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+
+    def resolve(self, url: str, post: Post) -> Path | None:
+        """The file ``url`` refers to, or None if missing or outside the source tree."""
+        path = _local_path(url)
+        if path is None:
+            return None
+        source = post.metadata.source_path
+        root = self.source_root or (source.parent if source else None)
+        if root is None:
+            return None
+        if path.startswith("/"):
+            base = root
+            path = path.lstrip("/")
+        else:
+            base = source.parent if source else root
+        candidate = (base / path).resolve()
+        if not candidate.is_relative_to(root.resolve()):
+            logger.warning("Asset %s referenced by %s is outside %s", url, post.metadata.slug, root)
+            return None
+        return candidate if candidate.is_file() else None
+
+    def _lock_for(self, digest: str) -> threading.Lock:
+        with self._guard:
+            return self._locks.setdefault(digest, threading.Lock())
+
+    def upload(self, path: Path) -> str:
+        digest = file_digest(path)
+        if digest in self._uploaded:
+            return self._uploaded[digest][1]
+
+        # One upload per content hash even when several posts share a file.
+        with self._lock_for(digest):
+            if digest in self._uploaded:
+                return self._uploaded[digest][1]
+            state = self.client.state
+            known = state.get_media(digest) if state else None
+            if known is None:
+                with metrics.timer("media.upload"):
+                    known = self.client.upload_media(path)
+                logger.info("Uploaded %s -> %s", path, known[1])
+                if state:
+                    state.record_media(digest, *known)
+            self._uploaded[digest] = known
+            return known[1]
+
+    def localize(self, post: Post) -> Post:
+        """Return ``post`` with its local asset URLs replaced by uploaded media URLs."""
+        files: dict[str, Path] = {}
+        for url in find_local_assets(post.html_content):
+            path = self.resolve(url, post)
+            if path is None:
+                logger.warning("Asset %s referenced by %s not found", url, post.metadata.slug)
+            else:
+                files[url] = path
+        if not files:
+            return post
+
+        with metrics.timer("post.media"):
+            futures = {url: self._pool.submit(self.upload, path) for url, path in files.items()}
+            uploaded = {}
+            for url, future in futures.items():
+                try:
+                    uploaded[url] = future.result()
+                except Exception as exc:
+                    # The post still publishes, pointing at the original URL.
+                    logger.warning("Could not upload %s for %s: %s", url, post.metadata.slug, exc)
+
+        def rewrite(element: re.Match) -> str:
+            tag = element.group("tag").lower()
+
+            def replace_url(attribute: re.Match) -> str:
+                url = _asset_url(tag, attribute)
+                new_url = uploaded.get(url) if url is not None else None
+                if new_url is None:
+                    return attribute.group(0)
+                quote = attribute.group("quote")
+                return f"{attribute.group('attr')}={quote}{new_url}{quote}"
+
+            return ASSET_ATTRIBUTE.sub(replace_url, element.group(0))
+
+        return replace(post, html_content=MEDIA_TAG.sub(rewrite, post.html_content))
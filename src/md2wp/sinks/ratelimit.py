@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+MAX_BACKOFF = 60.0
+# Longest server-requested Retry-After we will wait out; beyond it the request fails.
+MAX_RETRY_AFTER = 600.0
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt: int, retry_after: float | None = None) -> float:
+    """Delay before retry ``attempt`` (0-based), with jitter so clients do not retry in step."""
+    if retry_after is not None:
+        # Never retry before the server asked: its delay is a floor, not capped.
+        return retry_after * random.uniform(1.0, 1.2)
+    delay = min(MAX_BACKOFF, 2.0**attempt)
+    return random.uniform(delay / 2, delay)
+
+
+class RateLimiter:
+    """Token bucket plus AIMD concurrency limit shared by every request thread.
+
+    ``requests_per_second`` <= 0 disables the bucket. The concurrency limit
+    starts at ``max_concurrency``, halves when the server throttles (and all
+    requests pause for the requested delay), and grows back by roughly one
+    slot per window of successful requests.
+    """
+
+    def __init__(
+        self, requests_per_second: float = 0.0, burst: int = 1, max_concurrency: int = 1
+    ):
+        self.rate = requests_per_second
+        self.burst = max(1, burst)
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = float(self.max_concurrency)
+        self._cond = threading.Condition()
+        self._tokens = float(self.burst)
+        self._refilled = time.monotonic()
+        self._in_flight = 0
+        self._paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        if self.rate > 0:
+            elapsed = now - self._refilled
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+        self._refilled = now
+
+    def _wait_time(self, now: float) -> float | None:
+        """Seconds until a request may start, 0 if it may start now, None to wait for a slot."""
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._in_flight >= int(self.limit):
+            return None
+        if self.rate > 0 and self._tokens < 1:
+            return (1 - self._tokens) / self.rate
+        return 0.0
+
+    def acquire(self) -> None:
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._wait_time(now)
+                if wait == 0.0:
+                    break
+                self._cond.wait(wait)
+            if self.rate > 0:
+                self._tokens -= 1
+            self._in_flight += 1
+
+    def release(self, success: bool = True, pause: float = 0.0) -> None:
+        """Finish a request. ``pause`` > 0 means the server throttled us."""
+        with self._cond:
+            self._in_flight -= 1
+            if pause > 0:
+                self.limit = max(1.0, self.limit / 2)
+                self._paused_until = max(self._paused_until, time.monotonic() + pause)
+                self._tokens = 0.0
+            elif success:
+                self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+            self._cond.notify_all()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    site TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    post_id INTEGER NOT NULL,
+    payload_hash TEXT NOT NULL,
+    synced_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (site, slug)
+);
+CREATE TABLE IF NOT EXISTS media (
+    site TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    media_id INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    uploaded_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (site, sha256)
+)
+"""
+
+
+class SyncState:
+    def __init__(self, path: Path, site: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.site = site
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.executescript(SCHEMA)
+
+    def get(self, slug: str) -> tuple[int, str] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT post_id, payload_hash FROM posts WHERE site = ? AND slug = ?",
+                (self.site, slug),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def record(self, slug: str, post_id: int, payload_hash: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO posts (site, slug, post_id, payload_hash) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (site, slug) DO UPDATE SET post_id = excluded.post_id, "
+                "payload_hash = excluded.payload_hash, synced_at = CURRENT_TIMESTAMP",
+                (self.site, slug, post_id, payload_hash),
+            )
+
+    def forget(self, slug: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM posts WHERE site = ? AND slug = ?", (self.site, slug)
+            )
+
+    def get_media(self, sha256: str) -> tuple[int, str] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT media_id, url FROM media WHERE site = ? AND sha256 = ?",
+                (self.site, sha256),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def record_media(self, sha256: str, media_id: int, url: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO media (site, sha256, media_id, url) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (site, sha256) DO UPDATE SET media_id = excluded.media_id, "
+                "url = excluded.url, uploaded_at = CURRENT_TIMESTAMP",
+                (self.site, sha256, media_id, url),
+            )
+
+    def close(self) -> None:
+        self._conn.close()
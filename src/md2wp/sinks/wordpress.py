@@ -1,17 +1,71 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
+import html
+import json
+import mimetypes
+import re
+import threading
 import time
+import unicodedata
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from itertools import islice
+from pathlib import Path
 from typing import Any
+from urllib.parse import unquote, urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from md2wp import metrics
 from md2wp.config import Settings
 from md2wp.logging import get_logger
 from md2wp.models import ImportResult, Post
+from md2wp.sinks.journal import Journal
+from md2wp.sinks.media import MediaUploader
+from md2wp.sinks.ratelimit import (
+    MAX_RETRY_AFTER,
+    RateLimiter,
+    backoff_delay,
+    parse_retry_after,
+)
+from md2wp.sinks.state import SyncState
 
 logger = get_logger(__name__)
 
 RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+THROTTLE_STATUS_CODES = {429, 503}
+PAGE_SIZE = 100
+REST_NAMESPACE = "/wp/v2"
+BATCH_LIMIT = 25
+
+Outcome = tuple[str, int] | Exception
+
+
+# An ASCII letter followed by combining marks, i.e. a decomposed accented Latin letter.
+_ACCENT_RE = re.compile(r"([a-z])[\u0300-\u036f]+")
+
+
+def _term_key(name: str) -> str:
+    # Term names come back HTML-escaped ("Q&amp;A") from the REST API.
+    return html.unescape(name).strip().lower()
+
+
+def _slug_key(slug: str) -> str:
+    """The form WordPress stores ``slug`` in (cf. sanitize_title), percent-decoded.
+
+    Accents are stripped from Latin letters, dots and whitespace become
+    dashes, other punctuation is dropped and dashes are collapsed; other
+    scripts are kept (WordPress returns those percent-encoded).
+    """
+    text = unicodedata.normalize("NFKD", unquote(slug).lower())
+    text = _ACCENT_RE.sub(r"\1", text)
+    text = unicodedata.normalize("NFC", text)
+    text = re.sub(r"<[^>]*>|&[^;\s]+;", "", text).replace(".", "-")
+    text = re.sub(r"[^\w\s-]", "", text)
+    return re.sub(r"[\s-]+", "-", text).strip("-")
 
 
 class WordPressClient:
@@ -21,31 +75,118 @@ class WordPressClient:
         self.auth = (settings.wordpress_username, settings.wordpress_password)
         self._tag_cache: dict[str, int] = {}
         self._category_cache: dict[str, int] = {}
+        self._term_locks: dict[tuple[str, str], threading.Lock] = {}
+        self._term_locks_guard = threading.Lock()
+        self._terms_preloaded = False
+        self.state = (
+            SyncState(settings.state_path, self.base_url) if settings.state_path else None
+        )
+        self.session = self._build_session()
+        self.limiter = RateLimiter(
+            settings.requests_per_second,
+            settings.burst,
+            max(settings.pool_size, settings.concurrency),
+        )
+        self._slug_index: dict[str, dict[str, Any]] | None = None
+        self._batch_supported = True
+        self._batch_meta_supported = True
+        self.media: MediaUploader | None = None
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        session.auth = self.auth
+        pool_size = max(self.settings.pool_size, self.settings.concurrency)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Accept-Encoding"] = "gzip, deflate"
+        if not self.settings.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def close(self) -> None:
+        self.session.close()
+        if self.state:
+            self.state.close()
+
+    def _encode_body(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        if not self.settings.compress_requests or "json" not in kwargs:
+            return kwargs
+        body = json.dumps(kwargs["json"]).encode()
+        if len(body) < self.settings.compress_min_bytes:
+            return kwargs
+        kwargs = {k: v for k, v in kwargs.items() if k != "json"}
+        kwargs["data"] = gzip.compress(body)
+        kwargs["headers"] = {
+            **kwargs.get("headers", {}),
+            "Content-Type": "application/json",
+            "Content-Encoding": "gzip",
+        }
+        return kwargs
 
     def _request(self, method: str, path: str, **kwargs) -> requests.Response:
-        url = f"{self.base_url}{path}"
+        return self._send(method, f"{self.base_url}{path}", **kwargs)
+
+    def _endpoint(self, url: str) -> str:
+        if url.startswith(self.base_url):
+            return url[len(self.base_url) :] or "/"
+        return urlsplit(url).path
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs = self._encode_body(kwargs)
         last_exc: Exception | None = None
+        endpoint = self._endpoint(url)
 
-        for attempt in range(4):
+        retries = max(0, self.settings.max_retries)
+        for attempt in range(retries + 1):
+            self.limiter.acquire()
+            start = time.perf_counter()
             try:
-                response = requests.request(method, url, auth=self.auth, timeout=60, **kwargs)
+                response = self.session.request(method, url, timeout=60, **kwargs)
             except requests.RequestException as exc:
+                self.limiter.release(success=False)
+                metrics.observe_http(
+                    method, endpoint, type(exc).__name__, time.perf_counter() - start
+                )
                 last_exc = exc
-                if attempt == 3:
+                if attempt == retries:
                     raise
-                time.sleep(2**attempt)
+                delay = backoff_delay(attempt)
+                metrics.observe("http.retry_wait", delay)
+                time.sleep(delay)
                 continue
+            metrics.observe_http(
+                method, endpoint, response.status_code, time.perf_counter() - start
+            )
+
+            if response.status_code not in RETRY_STATUS_CODES:
+                self.limiter.release(success=response.status_code < 500)
+                return response
 
-            if response.status_code not in RETRY_STATUS_CODES or attempt == 3:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if attempt == retries or (retry_after or 0) > MAX_RETRY_AFTER:
+                if attempt < retries:
+                    logger.warning(
+                        "WordPress asked to retry after %.0fs, more than %.0fs; giving up",
+                        retry_after,
+                        MAX_RETRY_AFTER,
+                    )
+                self.limiter.release(success=False)
                 return response
 
-            retry_after = int(response.headers.get("Retry-After", 2**attempt))
+            delay = backoff_delay(attempt, retry_after)
             logger.warning(
-                "WordPress returned %s, retrying in %ss",
+                "WordPress returned %s, retrying in %.1fs",
                 response.status_code,
-                retry_after,
+                delay,
             )
-            time.sleep(retry_after)
+            metrics.observe("http.retry_wait", delay)
+            if response.status_code in THROTTLE_STATUS_CODES:
+                # Throttling is site-wide: pause every thread and shrink the window.
+                self.limiter.release(success=False, pause=delay)
+            else:
+                self.limiter.release(success=False)
+                time.sleep(delay)
 
         raise last_exc or RuntimeError("Request failed")
 
@@ -68,23 +209,85 @@ class WordPressClient:
                 f"WordPress connection failed ({response.status_code}): {response.text[:200]}"
             )
 
+    def _term_lock(self, endpoint: str, key: str) -> threading.Lock:
+        with self._term_locks_guard:
+            return self._term_locks.setdefault((endpoint, key), threading.Lock())
+
+    def _create_term(self, endpoint: str, name: str) -> int:
+        response = self._request("POST", endpoint, json={"name": name})
+        if response.status_code == 400 and response.json().get("code") == "term_exists":
+            return response.json()["data"]["term_id"]
+        response.raise_for_status()
+        return response.json()["id"]
+
     def _resolve_term(self, endpoint: str, cache: dict[str, int], name: str) -> int:
-        key = name.strip().lower()
+        key = _term_key(name)
         if key in cache:
             return cache[key]
 
-        response = self._request("GET", endpoint, params={"search": name, "per_page": 100})
-        response.raise_for_status()
-        for item in response.json():
-            if item.get("name", "").lower() == key:
-                cache[key] = item["id"]
-                return item["id"]
+        # Serialise lookups per term so concurrent workers never create it twice.
+        with self._term_lock(endpoint, key), metrics.timer("wp.resolve_term"):
+            if key in cache:
+                return cache[key]
+
+            if not self._terms_preloaded:
+                for item in self._fetch_all(endpoint, {"search": name}):
+                    if _term_key(item.get("name", "")) == key:
+                        cache[key] = item["id"]
+                        return item["id"]
+
+            term_id = self._create_term(endpoint, name)
+            cache[key] = term_id
+            return term_id
+
+    def _term_endpoints(self) -> dict[str, dict[str, int]]:
+        return {"/tags": self._tag_cache, "/categories": self._category_cache}
+
+    def preload_terms(self) -> None:
+        endpoints = self._term_endpoints()
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as pool:
+            listings = pool.map(
+                lambda endpoint: self._fetch_all(endpoint, {"_fields": "id,name"}), endpoints
+            )
+            for cache, items in zip(endpoints.values(), listings):
+                for item in items:
+                    cache.setdefault(_term_key(item["name"]), item["id"])
+        self._terms_preloaded = True
+        logger.info(
+            "Preloaded %d tags and %d categories",
+            len(self._tag_cache),
+            len(self._category_cache),
+        )
 
-        response = self._request("POST", endpoint, json={"name": name})
-        response.raise_for_status()
-        term_id = response.json()["id"]
-        cache[key] = term_id
-        return term_id
+    def create_missing_terms(self, posts: list[Post]) -> None:
+        caches = self._term_endpoints()
+        missing: dict[tuple[str, str], str] = {}
+        for post in posts:
+            for endpoint, names in (
+                ("/tags", post.metadata.tags),
+                ("/categories", post.metadata.categories),
+            ):
+                for name in names:
+                    key = _term_key(name)
+                    if key and key not in caches[endpoint]:
+                        missing.setdefault((endpoint, key), name.strip())
+        if not missing:
+            return
+
+        logger.info("Creating %d missing terms", len(missing))
+        workers = max(1, self.settings.concurrency)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="md2wp-terms") as pool:
+            futures = {
+                pool.submit(self._resolve_term, endpoint, caches[endpoint], name): (endpoint, name)
+                for (endpoint, _), name in missing.items()
+            }
+            for future, (endpoint, name) in futures.items():
+                try:
+                    future.result()
+                except requests.RequestException as exc:
+                    # Left uncached, so each post using it retries via _resolve_term
+                    # and only those posts fail if the site keeps refusing it.
+                    logger.warning("Could not create %s term %r: %s", endpoint[1:], name, exc)
 
     def _resolve_tags(self, tags: list[str]) -> list[int]:
         return [self._resolve_term("/tags", self._tag_cache, tag) for tag in tags if tag.strip()]
@@ -96,13 +299,57 @@ class WordPressClient:
             if category.strip()
         ]
 
+    def _fetch_page(self, endpoint: str, params: dict[str, Any], page: int) -> requests.Response:
+        response = self._request(
+            "GET", endpoint, params={**params, "per_page": PAGE_SIZE, "page": page}
+        )
+        response.raise_for_status()
+        return response
+
+    def _fetch_all(self, endpoint: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+        first = self._fetch_page(endpoint, params, 1)
+        items = list(first.json())
+        total_pages = int(first.headers.get("X-WP-TotalPages", 1))
+        if total_pages <= 1:
+            return items
+
+        workers = min(total_pages - 1, max(self.settings.pool_size, 1))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="md2wp-fetch") as pool:
+            pages = pool.map(
+                lambda page: self._fetch_page(endpoint, params, page).json(),
+                range(2, total_pages + 1),
+            )
+            for page_items in pages:
+                items.extend(page_items)
+        return items
+
+    def prefetch_posts(self) -> None:
+        fields = "id,slug,modified,meta" if self.settings.meta_in_payload else "id,slug,modified"
+        items = self._fetch_all("/posts", {"status": "any", "_fields": fields})
+        self._slug_index = {_slug_key(item["slug"]): item for item in items if item.get("slug")}
+        logger.info("Prefetched %d existing posts", len(self._slug_index))
+
+    def _indexed_post(self, slug: str, post_id: int) -> dict[str, Any] | None:
+        """Return the prefetched entry for ``slug`` if it is post ``post_id``."""
+        if self._slug_index is None:
+            return None
+        found = self._slug_index.get(_slug_key(slug))
+        return found if found and found.get("id") == post_id else None
+
     def _find_post_by_slug(self, slug: str) -> dict[str, Any] | None:
+        if self._slug_index is not None:
+            found = self._slug_index.get(_slug_key(slug))
+            # A slug WordPress would rewrite is looked up the old way on a
+            # miss, so an imperfect _slug_key cannot cause a duplicate post.
+            if found is not None or _slug_key(slug) == unquote(slug).lower():
+                return found
+
         response = self._request("GET", "/posts", params={"slug": slug, "status": "any"})
         response.raise_for_status()
         items = response.json()
         return items[0] if items else None
 
-    def _build_payload(self, post: Post) -> dict[str, Any]:
+    def _base_payload(self, post: Post) -> dict[str, Any]:
         payload: dict[str, Any] = {
             "title": post.metadata.title,
             "content": post.html_content,
@@ -112,7 +359,42 @@ class WordPressClient:
         }
         if post.metadata.excerpt:
             payload["excerpt"] = post.metadata.excerpt
+        return payload
+
+    def _post_meta(self, post: Post) -> dict[str, str]:
+        meta = {}
+        if post.metadata.shortlink:
+            meta["shortlink"] = post.metadata.shortlink
+        if post.metadata.lang:
+            meta["lang"] = post.metadata.lang
+        return meta
+
+    def _pending_meta(self, post: Post, existing: dict[str, Any] | None) -> dict[str, str]:
+        current = (existing or {}).get("meta") or {}
+        if not isinstance(current, dict):  # unregistered meta comes back as []
+            current = {}
+        return {
+            key: value for key, value in self._post_meta(post).items() if current.get(key) != value
+        }
 
+    def _with_meta(self, payload: dict[str, Any], meta: dict[str, str]) -> dict[str, Any]:
+        if self.settings.meta_in_payload and meta:
+            return {**payload, "meta": meta}
+        return payload
+
+    def payload_fingerprint(self, post: Post) -> str:
+        # Term names stand in for term IDs so the hash needs no HTTP calls.
+        data = {
+            **self._base_payload(post),
+            "tags": post.metadata.tags,
+            "categories": post.metadata.categories,
+            "meta": self._post_meta(post),
+        }
+        encoded = json.dumps(data, sort_keys=True, ensure_ascii=False).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _build_payload(self, post: Post) -> dict[str, Any]:
+        payload = self._base_payload(post)
         tag_ids = self._resolve_tags(post.metadata.tags)
         category_ids = self._resolve_categories(post.metadata.categories)
         if tag_ids:
@@ -131,18 +413,62 @@ class WordPressClient:
                 "Failed to set meta %s on post %s: %s", key, post_id, response.text[:200]
             )
 
+    def _sync_status(self, post: Post) -> tuple[str, int, bool]:
+        if not self.state:
+            return "", 0, False
+        fingerprint = self.payload_fingerprint(post)
+        record = self.state.get(post.metadata.slug)
+        if not record:
+            return fingerprint, 0, False
+        post_id, last_fingerprint = record
+        return fingerprint, post_id, self.settings.incremental and last_fingerprint == fingerprint
+
+    def _forget_post(self, slug: str) -> None:
+        if self.state:
+            self.state.forget(slug)
+        if self._slug_index is not None:
+            self._slug_index.pop(_slug_key(slug), None)
+
+    def _remember_post(self, post: Post, post_id: int, fingerprint: str) -> None:
+        slug = post.metadata.slug
+        if self._slug_index is not None:
+            meta = self._post_meta(post)
+            self._slug_index[_slug_key(slug)] = {"id": post_id, "slug": slug, "meta": meta}
+        if self.state:
+            self.state.record(slug, post_id, fingerprint)
+
     def publish_post(self, post: Post) -> tuple[str, int]:
-        payload = self._build_payload(post)
-        existing = self._find_post_by_slug(post.metadata.slug)
+        slug = post.metadata.slug
+        fingerprint, post_id, unchanged = self._sync_status(post)
+        if unchanged:
+            return "unchanged", post_id
 
-        if existing:
-            post_id = existing["id"]
-            response = self._request("PUT", f"/posts/{post_id}", json=payload)
+        payload = self._build_payload(post)
+        response = None
+        if post_id:
+            meta = self._pending_meta(post, self._indexed_post(slug, post_id))
+            response = self._request(
+                "PUT", f"/posts/{post_id}", json=self._with_meta(payload, meta)
+            )
             action = "updated"
-        else:
-            response = self._request("POST", "/posts", json=payload)
-            action = "created"
-            post_id = response.json().get("id") if response.ok else 0
+            if response.status_code in (404, 410):
+                logger.info("Post %s for %s is gone, looking up by slug", post_id, slug)
+                self._forget_post(slug)
+                response = None
+
+        if response is None:
+            existing = self._find_post_by_slug(slug)
+            meta = self._pending_meta(post, existing)
+            if existing:
+                post_id = existing["id"]
+                response = self._request(
+                    "PUT", f"/posts/{post_id}", json=self._with_meta(payload, meta)
+                )
+                action = "updated"
+            else:
+                response = self._request("POST", "/posts", json=self._with_meta(payload, meta))
+                action = "created"
+                post_id = response.json().get("id") if response.ok else 0
 
         if response.status_code not in (200, 201):
             raise RuntimeError(
@@ -151,31 +477,278 @@ class WordPressClient:
             )
 
         if post_id:
-            if post.metadata.shortlink:
-                self._set_post_meta(post_id, "shortlink", post.metadata.shortlink)
-            if post.metadata.lang:
-                self._set_post_meta(post_id, "lang", post.metadata.lang)
+            if not self.settings.meta_in_payload:
+                for key, value in meta.items():
+                    self._set_post_meta(post_id, key, value)
+            self._remember_post(post, post_id, fingerprint)
 
         return action, post_id
 
+    def upload_media(self, path: Path) -> tuple[int, str]:
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        response = self._request(
+            "POST",
+            "/media",
+            data=path.read_bytes(),
+            headers={
+                "Content-Type": content_type,
+                "Content-Disposition": f'attachment; filename="{path.name}"',
+            },
+        )
+        if response.status_code not in (200, 201):
+            raise RuntimeError(
+                f"Failed to upload {path} ({response.status_code}): {response.text[:300]}"
+            )
+        body = response.json()
+        return body["id"], body["source_url"]
 
-def publish_to_wordpress(posts: list[Post], settings: Settings) -> ImportResult:
-    client = WordPressClient(settings)
-    client._ensure_auth()
+    def _batch_url(self) -> str | None:
+        if not self.base_url.endswith(REST_NAMESPACE):
+            return None
+        return f"{self.base_url[: -len(REST_NAMESPACE)]}/batch/v1"
 
-    result = ImportResult(posts=posts, dry_run=False)
-    for post in posts:
+    def _send_batch(self, sub_requests: list[dict[str, Any]]) -> list[dict[str, Any]] | None:
+        url = self._batch_url()
+        if not url or not self._batch_supported:
+            return None
+
+        response = self._send("POST", url, json={"requests": sub_requests})
+        if response.status_code in (404, 405, 501):
+            logger.warning(
+                "WordPress batch API is not available (%s); using single requests",
+                response.status_code,
+            )
+            self._batch_supported = False
+            return None
+        response.raise_for_status()
+        return response.json()["responses"]
+
+    def _localize(self, post: Post) -> Post:
+        return self.media.localize(post) if self.media else post
+
+    def _publish_single(self, post: Post) -> Outcome:
         try:
-            action, _ = client.publish_post(post)
-            if action == "updated":
-                result.updated += 1
-                logger.info("Updated: %s", post.metadata.title)
-            else:
-                result.published += 1
-                logger.info("Published: %s", post.metadata.title)
+            with metrics.timer("post.publish"):
+                return self.publish_post(self._localize(post))
         except Exception as exc:
-            result.failed += 1
-            path = post.metadata.source_path or post.metadata.slug
-            logger.error("Failed to publish %s: %s", path, exc)
+            return exc
+
+    def publish_each(self, posts: list[Post]) -> list[Outcome]:
+        return [self._publish_single(post) for post in posts]
+
+    def publish_batch(self, posts: list[Post]) -> list[Outcome]:
+        """Publish up to BATCH_LIMIT posts through /batch/v1, one outcome per post."""
+        with metrics.timer("wp.publish_batch"):
+            return self._publish_batch(posts)
+
+    def _publish_batch(self, posts: list[Post]) -> list[Outcome]:
+        outcomes: list[Outcome | None] = [None] * len(posts)
+        writes: list[tuple[int, str, int, str, dict[str, str]]] = []
+        sub_requests: list[dict[str, Any]] = []
+
+        for index, post in enumerate(posts):
+            try:
+                post = self._localize(post)
+                fingerprint, post_id, unchanged = self._sync_status(post)
+                if unchanged:
+                    outcomes[index] = ("unchanged", post_id)
+                    continue
+                payload = self._build_payload(post)
+                existing = self._indexed_post(post.metadata.slug, post_id)
+                if not post_id:
+                    existing = self._find_post_by_slug(post.metadata.slug)
+                    post_id = existing["id"] if existing else 0
+                meta = self._pending_meta(post, existing)
+            except Exception as exc:
+                outcomes[index] = exc
+                continue
+
+            if post_id:
+                writes.append((index, "updated", post_id, fingerprint, meta))
+                path, method = f"{REST_NAMESPACE}/posts/{post_id}", "PUT"
+            else:
+                writes.append((index, "created", 0, fingerprint, meta))
+                path, method = f"{REST_NAMESPACE}/posts", "POST"
+            body = self._with_meta(payload, meta)
+            sub_requests.append({"method": method, "path": path, "body": body})
+
+        responses = self._send_batch(sub_requests) if sub_requests else []
+        if responses is None:
+            for index, *_ in writes:
+                outcomes[index] = self._publish_single(posts[index])
+            return outcomes
+
+        written: list[tuple[Post, int, str, dict[str, str]]] = []
+        for (index, action, post_id, fingerprint, meta), response in zip(writes, responses):
+            post = posts[index]
+            status = response.get("status", 500)
+            body = response.get("body") or {}
+            if action == "updated" and status in (404, 410):
+                slug = post.metadata.slug
+                logger.info("Post %s for %s is gone, looking up by slug", post_id, slug)
+                self._forget_post(slug)
+                outcomes[index] = self._publish_single(post)
+            elif status not in (200, 201):
+                outcomes[index] = RuntimeError(
+                    f"Failed to {action} post '{post.metadata.title}' "
+                    f"({status}): {json.dumps(body)[:300]}"
+                )
+            else:
+                post_id = post_id or body.get("id", 0)
+                outcomes[index] = (action, post_id)
+                if post_id:
+                    written.append((post, post_id, fingerprint, meta))
+
+        self._write_meta_batch(written)
+        return outcomes
+
+    def _write_meta_batch(self, written: list[tuple[Post, int, str, dict[str, str]]]) -> None:
+        meta_writes = []
+        if not self.settings.meta_in_payload:
+            meta_writes = [
+                (post_id, key, value)
+                for _, post_id, _, meta in written
+                for key, value in meta.items()
+            ]
+        for start in range(0, len(meta_writes), BATCH_LIMIT):
+            chunk = meta_writes[start : start + BATCH_LIMIT]
+            responses = None
+            if self._batch_meta_supported:
+                responses = self._send_batch(
+                    [
+                        {
+                            "method": "POST",
+                            "path": f"{REST_NAMESPACE}/posts/{post_id}/meta",
+                            "body": {"key": key, "value": value},
+                        }
+                        for post_id, key, value in chunk
+                    ]
+                )
+            if responses is None:
+                for post_id, key, value in chunk:
+                    self._set_post_meta(post_id, key, value)
+                continue
+
+            for (post_id, key, value), response in zip(chunk, responses):
+                body = response.get("body") or {}
+                if body.get("code") == "rest_batch_not_allowed":
+                    # The meta route is not batchable on this site.
+                    self._batch_meta_supported = False
+                    self._set_post_meta(post_id, key, value)
+                elif response.get("status", 500) >= 400:
+                    logger.warning(
+                        "Failed to set meta %s on post %s: %s",
+                        key,
+                        post_id,
+                        json.dumps(body)[:200],
+                    )
+
+        for post, post_id, fingerprint, _ in written:
+            self._remember_post(post, post_id, fingerprint)
+
+
+def _tally(
+    result: ImportResult, post: Post, outcome: Outcome, journal: Journal | None = None
+) -> None:
+    if isinstance(outcome, Exception):
+        result.failed += 1
+        path = post.metadata.source_path or post.metadata.slug
+        logger.error("Failed to publish %s: %s", path, outcome)
+        return
+
+    action, post_id = outcome
+    if journal:
+        journal.record(post.metadata.slug, post_id, action)
+    if action == "unchanged":
+        result.unchanged += 1
+        logger.debug("Unchanged: %s", post.metadata.title)
+    elif action == "updated":
+        result.updated += 1
+        logger.info("Updated: %s", post.metadata.title)
+    else:
+        result.published += 1
+        logger.info("Published: %s", post.metadata.title)
+
+
+def _collect(
+    result: ImportResult, group: list[Post], future: Future, journal: Journal | None
+) -> None:
+    try:
+        outcomes = future.result()
+    except Exception as exc:
+        outcomes = [exc] * len(group)
+    for post, outcome in zip(group, outcomes):
+        _tally(result, post, outcome, journal)
+
+
+def _unjournaled(posts: Iterable[Post], journal: Journal, result: ImportResult) -> Iterator[Post]:
+    for post in posts:
+        if post.metadata.slug in journal.completed:
+            result.resumed += 1
+            logger.debug("Already published (journal): %s", post.metadata.title)
+        else:
+            yield post
+
 
+def _groups(posts: Iterable[Post], size: int) -> Iterator[list[Post]]:
+    iterator = iter(posts)
+    while group := list(islice(iterator, size)):
+        yield group
+
+
+def publish_to_wordpress(posts: Iterable[Post], settings: Settings) -> ImportResult:
+    client = WordPressClient(settings)
+    journal = None
+    try:
+        client._ensure_auth()
+        try:
+            if settings.prefetch_posts:
+                client.prefetch_posts()
+            if settings.preload_terms:
+                client.preload_terms()
+        except requests.RequestException as exc:
+            raise ValueError(f"Could not preload existing WordPress content: {exc}") from exc
+        if settings.preload_terms and isinstance(posts, list):
+            client.create_missing_terms(posts)
+
+        if settings.upload_media:
+            client.media = MediaUploader(client, settings.source, settings.media_concurrency)
+
+        result = ImportResult(posts=posts if isinstance(posts, list) else [], dry_run=False)
+        if settings.journal_path:
+            journal = Journal(settings.journal_path, client.base_url, resume=settings.resume)
+            if journal.completed:
+                posts = _unjournaled(posts, journal, result)
+
+        if settings.batch:
+            groups = _groups(posts, BATCH_LIMIT)
+            publish = client.publish_batch
+        else:
+            groups = _groups(posts, 1)
+            publish = client.publish_each
+
+        workers = max(1, settings.concurrency)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="md2wp-publish") as pool:
+            # Keep a bounded number of groups in flight so streamed posts are not
+            # all pulled into memory at once. Counters are only touched here.
+            pending: dict[Future, list[Post]] = {}
+            for group in groups:
+                if len(pending) >= workers * 2:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        _collect(result, pending.pop(future), future, journal)
+                pending[pool.submit(publish, group)] = group
+            for future in as_completed(pending):
+                _collect(result, pending[future], future, journal)
+
+        # A clean run leaves nothing to resume; failures keep the journal so
+        # --resume retries only what did not go through.
+        if journal and not result.failed:
+            journal.finish()
+    finally:
+        if journal:
+            journal.close()
+        if client.media:
+            client.media.close()
+        client.close()
     return result
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import hashlib
+import json
+import os
+import re
+from collections.abc import Iterable, Iterator
 from datetime import timezone
+from pathlib import Path
 from xml.sax.saxutils import escape
 
+from md2wp import metrics
 from md2wp.config import Settings
 from md2wp.logging import get_logger
 from md2wp.models import ImportResult, Post
@@ -22,15 +28,7 @@ def _stable_post_id(slug: str) -> int:
     return int(digest[:8], 16) % 900000 + 100000
 
 
-def export_to_wxr(posts: list[Post], settings: Settings) -> ImportResult:
-    if not settings.output:
-        raise ValueError("Output path is required for WXR export (--output)")
-    if not settings.domain:
-        raise ValueError("Domain is required for WXR export (--domain or site.domain in config)")
-
-    domain = settings.domain.rstrip("/")
-    creator = settings.wordpress_username or "md2wp"
-
+def _channel_header(settings: Settings, domain: str) -> str:
     lines = [
         '<?xml version="1.0" encoding="UTF-8" ?>',
         '<rss version="2.0"',
@@ -46,66 +44,204 @@ def export_to_wxr(posts: list[Post], settings: Settings) -> ImportResult:
         f"    <language>{escape(settings.site_language)}</language>",
         "    <wp:wxr_version>1.2</wp:wxr_version>",
     ]
+    return "\n".join(lines) + "\n"
 
-    for post in posts:
-        slug = post.metadata.slug
-        post_id = _stable_post_id(slug)
-        formatted_date = _format_wxr_datetime(post.metadata.date)
-        link = f"{domain}/{slug}/"
-
-        lines.extend(
-            [
-                "    <item>",
-                f"        <title>{escape(post.metadata.title)}</title>",
-                f"        <link>{escape(link)}</link>",
-                f"        <pubDate>{escape(formatted_date)}</pubDate>",
-                f"        <dc:creator>{escape(creator)}</dc:creator>",
-                f'        <guid isPermaLink="false">{escape(link)}</guid>',
-                "        <description></description>",
-                f"        <content:encoded><![CDATA[{post.html_content}]]></content:encoded>",
-                f"        <excerpt:encoded><![CDATA[{post.metadata.excerpt}]]></excerpt:encoded>",
-                f"        <wp:post_id>{post_id}</wp:post_id>",
-                f"        <wp:post_date><![CDATA[{formatted_date}]]></wp:post_date>",
-                f"        <wp:post_date_gmt><![CDATA[{formatted_date}]]></wp:post_date_gmt>",
-                f"        <wp:post_modified><![CDATA[{formatted_date}]]></wp:post_modified>",
-                f"        <wp:post_modified_gmt>"
-                f"<![CDATA[{formatted_date}]]></wp:post_modified_gmt>",
-                "        <wp:comment_status>closed</wp:comment_status>",
-                "        <wp:ping_status>closed</wp:ping_status>",
-                f"        <wp:post_name>{escape(slug)}</wp:post_name>",
-                f"        <wp:status>{settings.status.value}</wp:status>",
-                "        <wp:post_parent>0</wp:post_parent>",
-                "        <wp:menu_order>0</wp:menu_order>",
-                "        <wp:post_type>post</wp:post_type>",
-                "        <wp:post_password></wp:post_password>",
-                "        <wp:is_sticky>0</wp:is_sticky>",
-            ]
+
+CHANNEL_FOOTER = "</channel>\n</rss>\n"
+
+
+def _render_item(post: Post, settings: Settings, domain: str, creator: str) -> str:
+    slug = post.metadata.slug
+    post_id = _stable_post_id(slug)
+    formatted_date = _format_wxr_datetime(post.metadata.date)
+    link = f"{domain}/{slug}/"
+
+    lines = [
+        "    <item>",
+        f"        <title>{escape(post.metadata.title)}</title>",
+        f"        <link>{escape(link)}</link>",
+        f"        <pubDate>{escape(formatted_date)}</pubDate>",
+        f"        <dc:creator>{escape(creator)}</dc:creator>",
+        f'        <guid isPermaLink="false">{escape(link)}</guid>',
+        "        <description></description>",
+        f"        <content:encoded><![CDATA[{post.html_content}]]></content:encoded>",
+        f"        <excerpt:encoded><![CDATA[{post.metadata.excerpt}]]></excerpt:encoded>",
+        f"        <wp:post_id>{post_id}</wp:post_id>",
+        f"        <wp:post_date><![CDATA[{formatted_date}]]></wp:post_date>",
+        f"        <wp:post_date_gmt><![CDATA[{formatted_date}]]></wp:post_date_gmt>",
+        f"        <wp:post_modified><![CDATA[{formatted_date}]]></wp:post_modified>",
+        f"        <wp:post_modified_gmt><![CDATA[{formatted_date}]]></wp:post_modified_gmt>",
+        "        <wp:comment_status>closed</wp:comment_status>",
+        "        <wp:ping_status>closed</wp:ping_status>",
+        f"        <wp:post_name>{escape(slug)}</wp:post_name>",
+        f"        <wp:status>{settings.status.value}</wp:status>",
+        "        <wp:post_parent>0</wp:post_parent>",
+        "        <wp:menu_order>0</wp:menu_order>",
+        "        <wp:post_type>post</wp:post_type>",
+        "        <wp:post_password></wp:post_password>",
+        "        <wp:is_sticky>0</wp:is_sticky>",
+    ]
+
+    for category in post.metadata.categories:
+        nicename = category.lower().replace(" ", "-")
+        lines.append(
+            f'        <category domain="category" nicename="{escape(nicename)}">'
+            f"<![CDATA[{category}]]></category>"
         )
 
-        for category in post.metadata.categories:
-            nicename = category.lower().replace(" ", "-")
-            lines.append(
-                f'        <category domain="category" nicename="{escape(nicename)}">'
-                f"<![CDATA[{category}]]></category>"
-            )
+    for tag in post.metadata.tags:
+        nicename = tag.lower().replace(" ", "-")
+        lines.append(
+            f'        <category domain="post_tag" nicename="{escape(nicename)}">'
+            f"<![CDATA[{tag}]]></category>"
+        )
+
+    lines.append("    </item>")
+    return "\n".join(lines) + "\n"
+
+
+def _render_items(posts: Iterable[Post], settings: Settings, domain: str) -> Iterator[bytes]:
+    # Rendering is a cheap template; shipping posts to worker processes and
+    # items back would cost far more than it saves, so it stays in-process.
+    creator = settings.wordpress_username or "md2wp"
+    for post in posts:
+        with metrics.timer("post.render_wxr"):
+            data = _render_item(post, settings, domain, creator).encode("utf-8")
+        yield data
+
+
+class _WxrFile:
+    def __init__(self, path: Path, header: bytes):
+        self.path = path
+        self.posts = 0
+        self.size = 0
+        self._digest = hashlib.sha256()
+        self._tmp = path.with_name(f".{path.name}.tmp")
+        self._file = self._tmp.open("wb")
+        self.write(header)
+
+    def write(self, data: bytes) -> None:
+        self._file.write(data)
+        self._digest.update(data)
+        self.size += len(data)
+
+    def add_item(self, data: bytes) -> None:
+        self.write(data)
+        self.posts += 1
+
+    def fits(self, data: bytes, max_items: int, max_bytes: int) -> bool:
+        if not self.posts:
+            return True
+        if max_items and self.posts >= max_items:
+            return False
+        footer_size = len(CHANNEL_FOOTER)
+        return not max_bytes or self.size + len(data) + footer_size <= max_bytes
+
+    def finish(self) -> dict[str, object]:
+        self.write(CHANNEL_FOOTER.encode("utf-8"))
+        self._file.close()
+        os.replace(self._tmp, self.path)
+        return {
+            "file": self.path.name,
+            "posts": self.posts,
+            "bytes": self.size,
+            "sha256": self._digest.hexdigest(),
+        }
+
+    def discard(self) -> None:
+        self._file.close()
+        self._tmp.unlink(missing_ok=True)
+
+
+def write_wxr(posts: Iterable[Post], path: Path, settings: Settings) -> int:
+    """Stream a WXR document to ``path`` one item at a time; returns the item count."""
+    domain = settings.domain.rstrip("/")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    wxr = _WxrFile(path, _channel_header(settings, domain).encode("utf-8"))
+    try:
+        for item in _render_items(posts, settings, domain):
+            wxr.add_item(item)
+        wxr.finish()
+    except BaseException:
+        wxr.discard()
+        raise
+    return wxr.posts
+
 
-        for tag in post.metadata.tags:
-            nicename = tag.lower().replace(" ", "-")
-            lines.append(
-                f'        <category domain="post_tag" nicename="{escape(nicename)}">'
-                f"<![CDATA[{tag}]]></category>"
-            )
+def shard_path(output: Path, index: int) -> Path:
+    return output.with_name(f"{output.stem}-{index:04d}{output.suffix}")
 
-        lines.append("    </item>")
 
-    lines.extend(["</channel>", "</rss>"])
+def manifest_path(output: Path) -> Path:
+    return output.with_name(f"{output.stem}-manifest.json")
+
+
+def write_wxr_shards(posts: Iterable[Post], output: Path, settings: Settings) -> list[dict]:
+    """Write ``output``-0001.xml, -0002.xml, ... bounded by max_items / max_bytes.
+
+    Every shard carries its own channel header and a manifest lists shard
+    names, post counts, sizes and checksums.
+    """
+    domain = settings.domain.rstrip("/")
+    header = _channel_header(settings, domain).encode("utf-8")
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    shards: list[dict] = []
+    current: _WxrFile | None = None
+    try:
+        for item in _render_items(posts, settings, domain):
+            if current and not current.fits(item, settings.max_items, settings.max_bytes):
+                shards.append(current.finish())
+                current = None
+            if current is None:
+                current = _WxrFile(shard_path(output, len(shards) + 1), header)
+            current.add_item(item)
+        if current:
+            shards.append(current.finish())
+            current = None
+    finally:
+        if current:
+            current.discard()
+
+    _remove_stale_shards(output, {shard["file"] for shard in shards})
+    manifest = {"total_posts": sum(shard["posts"] for shard in shards), "shards": shards}
+    manifest_path(output).write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return shards
+
+
+def _remove_stale_shards(output: Path, keep: set[str]) -> None:
+    try:
+        previous = json.loads(manifest_path(output).read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return
+    # Only delete files this exporter could have written next to ``output``;
+    # the manifest is untrusted input.
+    pattern = re.compile(rf"{re.escape(output.stem)}-\d{{4,}}{re.escape(output.suffix)}")
+    for shard in previous.get("shards", []):
+        name = shard.get("file") if isinstance(shard, dict) else None
+        if not isinstance(name, str) or name in keep or not pattern.fullmatch(name):
+            continue
+        (output.parent / name).unlink(missing_ok=True)
+
+
+def export_to_wxr(posts: Iterable[Post], settings: Settings) -> ImportResult:
+    if not settings.output:
+        raise ValueError("Output path is required for WXR export (--output)")
+    if not settings.domain:
+        raise ValueError("Domain is required for WXR export (--domain or site.domain in config)")
 
-    settings.output.parent.mkdir(parents=True, exist_ok=True)
-    settings.output.write_text("\n".join(lines) + "\n", encoding="utf-8")
-    logger.info("Exported %d posts to %s", len(posts), settings.output)
+    if settings.max_items or settings.max_bytes:
+        shards = write_wxr_shards(posts, settings.output, settings)
+        count = sum(shard["posts"] for shard in shards)
+        export_path = manifest_path(settings.output)
+        logger.info("Exported %d posts to %d WXR files (%s)", count, len(shards), export_path)
+    else:
+        count = write_wxr(posts, settings.output, settings)
+        export_path = settings.output
+        logger.info("Exported %d posts to %s", count, export_path)
 
     return ImportResult(
-        posts=posts,
-        export_path=settings.output,
+        exported=count,
+        export_path=export_path,
         dry_run=False,
     )
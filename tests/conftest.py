@@ -0,0 +1,39 @@
+import importlib.util
+import re
+
+import pytest
+
+from md2wp.parsers.html_backends import BACKENDS
+from md2wp.parsers.renderers import RENDERERS
+
+# Fixture name -> backend registry it runs over. Backends whose package is
+# not installed are skipped.
+OPTIONAL_BACKENDS = {"backend": BACKENDS, "renderer": RENDERERS}
+
+
+def pytest_generate_tests(metafunc):
+    for fixture, registry in OPTIONAL_BACKENDS.items():
+        if fixture not in metafunc.fixturenames:
+            continue
+        params = [
+            pytest.param(
+                name,
+                marks=pytest.mark.skipif(
+                    importlib.util.find_spec(module) is None, reason=f"{module} not installed"
+                ),
+            )
+            for name, (_, module) in sorted(registry.items())
+        ]
+        metafunc.parametrize(fixture, params)
+
+
+def _normalize_html(html: str) -> str:
+    html = re.sub(r"<br\s*/?>", "<br>", html)
+    html = re.sub(r"(<t[dh])\s+style=\"[^\"]*\"", r"\1", html)
+    return re.sub(r">\s+<", "><", re.sub(r"\s+", " ", html)).strip()
+
+
+@pytest.fixture
+def normalize_html():
+    """Compare HTML from different backends without their whitespace and quirks."""
+    return _normalize_html
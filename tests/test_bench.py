@@ -0,0 +1,48 @@
+import pytest
+
+from md2wp.bench import FakeWordPress, generate_corpus, run_benchmark
+from md2wp.config import ImportMode, Settings
+from md2wp.parsers.markdown import discover_and_parse_markdown
+from md2wp.sinks.wordpress import publish_to_wordpress
+
+
+def test_markdown_corpus_parses_cleanly(tmp_path):
+    generate_corpus(tmp_path, 12, ImportMode.MARKDOWN)
+    posts, errors, skipped = discover_and_parse_markdown(tmp_path, Settings())
+
+    assert len(posts) == 12 and errors == [] and skipped == []
+    assert any("<table>" in post.html_content for post in posts)
+    assert any("<code" in post.html_content for post in posts)
+
+
+def test_fake_wordpress_round_trip(tmp_path):
+    generate_corpus(tmp_path, 4, ImportMode.MARKDOWN)
+    posts, _, _ = discover_and_parse_markdown(tmp_path, Settings())
+
+    with FakeWordPress() as site:
+        settings = Settings(
+            wordpress_url=site.url, wordpress_username="u", wordpress_password="p"
+        )
+        first = publish_to_wordpress(posts, settings)
+        again = publish_to_wordpress(posts, settings)
+
+    assert first.published == 4 and first.failed == 0
+    assert again.updated == 4
+    assert len(site.posts) == 4
+    assert all(post["meta"]["shortlink"] for post in site.posts.values())
+
+
+@pytest.mark.parametrize("mode", [ImportMode.MARKDOWN, ImportMode.HUGO_BUILD])
+def test_run_benchmark_reports_every_stage(tmp_path, mode):
+    report = run_benchmark(Settings(mode=mode), tmp_path, posts=6)
+
+    expected = {"discover", "parse", "export", "publish"}
+    if mode == ImportMode.MARKDOWN:
+        expected.add("front_matter")
+    assert set(report["stages"]) == expected
+    for stage in report["stages"].values():
+        assert stage["items"] == 6
+    assert report["stages"]["parse"]["errors"] == 0
+    assert report["stages"]["publish"]["failed"] == 0
+    assert report["stages"]["parse"]["p95_ms"] >= report["stages"]["parse"]["p50_ms"]
+    assert all("peak_rss_mb" not in stage for stage in report["stages"].values())
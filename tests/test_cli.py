@@ -1,8 +1,13 @@
+import subprocess
+import sys
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
+from md2wp.bench import generate_corpus
 from md2wp.cli import app
+from md2wp.config import ImportMode
 
 runner = CliRunner()
 FIXTURES = Path(__file__).parent / "fixtures"
@@ -46,3 +51,46 @@ def test_config_show():
     result = runner.invoke(app, ["config", "show"])
     assert result.exit_code == 0
     assert '"mode"' in result.stdout
+
+
+# Generous, so only a real regression (e.g. an eager parser or sink import) trips it.
+STARTUP_BUDGET_SECONDS = 1.0
+HEAVY_MODULES = {"requests", "bs4", "markdown", "frontmatter", "yaml", "md2wp.pipeline"}
+
+
+def _imports(args: list[str], cwd: Path) -> dict[str, int]:
+    """Run ``python -X importtime <args>``; map each module to its cumulative microseconds."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    "args",
+    [["-c", "import md2wp.cli"], ["-m", "md2wp", "config", "show"]],
+    ids=["import", "config-show"],
+)
+def test_startup_skips_parsers_and_sinks(args, tmp_path):
+    times = _imports(args, tmp_path)
+    assert "md2wp.cli" in times
+    assert not HEAVY_MODULES & times.keys()
+    assert times["md2wp.cli"] / 1e6 < STARTUP_BUDGET_SECONDS
+
+
+def test_hugo_mode_skips_markdown_parser(tmp_path):
+    source = generate_corpus(tmp_path / "site", 3, ImportMode.HUGO_BUILD)
+    args = ["-m", "md2wp", "validate", "-s", str(source), "--mode", "hugo-build"]
+    times = _imports(args, tmp_path)
+    assert "md2wp.parsers.hugo_build" in times
+    assert not {"yaml", "md2wp.parsers.markdown", "md2wp.parsers.front_matter"} & times.keys()
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+from md2wp.config import HugoBuildSelectors, Settings
+from md2wp.discovery import discover_files
+from md2wp.parsers.hugo_build import discover_hugo_build_files
+from md2wp.parsers.markdown import discover_and_parse_markdown
+
+
+def _touch(path: Path, text: str = "") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_discover_files_matches_sorted_glob(tmp_path):
+    for i in range(30):
+        _touch(tmp_path / f"d{i % 4}" / f"sub{i % 3}" / f"post-{i}.md")
+    _touch(tmp_path / "notes.txt")
+
+    expected = sorted(tmp_path.glob("**/*.md"))
+    assert list(discover_files(tmp_path, lambda n: n.endswith(".md"), workers=4)) == expected
+
+    unsorted = discover_files(tmp_path, lambda n: n.endswith(".md"), workers=4, sort=False)
+    assert sorted(unsorted) == expected
+
+    top_level = discover_files(tmp_path, lambda n: n.endswith(".md"), recursive=False)
+    assert list(top_level) == []
+
+
+def test_hugo_discovery_prunes_non_year_dirs(tmp_path):
+    kept = _touch(tmp_path / "2023" / "01" / "post" / "index.html")
+    _touch(tmp_path / "tags" / "go" / "index.html")
+    _touch(tmp_path / "2023" / "archive" / "index.html")
+    root = _touch(tmp_path / "index.html")
+
+    found = list(discover_hugo_build_files(tmp_path, Settings()))
+    assert found == sorted([root, kept, tmp_path / "2023" / "archive" / "index.html"])
+
+    settings = Settings(hugo_build=HugoBuildSelectors(filter_year_dirs=False))
+    assert len(list(discover_hugo_build_files(tmp_path, settings))) == 4
+
+
+def test_name_skips_do_not_read_files(tmp_path, mocker):
+    _touch(tmp_path / "_index.md", "---\ntitle: Section\n---\n")
+    _touch(tmp_path / ".hidden.md", "---\ntitle: Hidden\n---\n")
+    load = mocker.patch("md2wp.parsers.markdown.front_matter.load")
+
+    posts, errors, skipped = discover_and_parse_markdown(tmp_path, Settings())
+
+    assert posts == [] and errors == []
+    assert sorted(reason for _, reason in skipped) == ["hidden file", "index file"]
+    load.assert_not_called()
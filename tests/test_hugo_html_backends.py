@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+
+from md2wp.config import HugoBuildSelectors, Settings
+from md2wp.parsers.html_backends import compile_selectors, get_backend
+from md2wp.parsers.hugo_build import iter_hugo_build_posts, parse_hugo_index_html
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_backend_matches_html_parser_on_fixture(backend, normalize_html):
+    html = (FIXTURES / "hugo-index.html").read_text(encoding="utf-8")
+    selectors = HugoBuildSelectors()
+    expected = get_backend("html.parser")(html, selectors)
+    page = get_backend(backend)(html, selectors)
+
+    assert page.title == expected.title == "Sample Hugo Post"
+    assert page.date == expected.date
+    assert page.tags == expected.tags == ["Go", "Hugo"]
+    assert page.breadcrumbs == expected.breadcrumbs
+    assert page.lang == expected.lang == "en"
+    assert normalize_html(page.content_html) == normalize_html(expected.content_html)
+
+
+def test_backend_parses_post(backend):
+    settings = Settings(hugo_build=HugoBuildSelectors(parser=backend))
+    post = parse_hugo_index_html(FIXTURES / "hugo-index.html", FIXTURES, settings)
+    assert post.metadata.title == "Sample Hugo Post"
+    assert post.metadata.date.year == 2023
+    assert post.metadata.categories == ["TechBlog"]
+    assert "Hugo rendered content" in post.html_content
+
+
+def test_backend_nested_text_and_missing_elements(backend):
+    html = (
+        '<html><body><h1 class="post-title"> Hello <em>World</em> </h1>'
+        '<div class="post-meta"><span>2024-01-02</span></div></body></html>'
+    )
+    selectors = HugoBuildSelectors(date_selector="div.post-meta span")
+    page = get_backend(backend)(html, selectors)
+    assert page.title == "HelloWorld"
+    assert page.date == "2024-01-02"
+    assert page.content_html is None
+    assert page.tags == []
+    assert page.lang is None
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown hugo_build.parser"):
+        get_backend("regex")
+
+
+def test_selectors_compiled_once_per_configuration():
+    selectors = HugoBuildSelectors()
+    assert compile_selectors(selectors) is compile_selectors(HugoBuildSelectors())
+    assert compile_selectors(selectors) is not compile_selectors(
+        HugoBuildSelectors(title_selector="h1")
+    )
+
+
+def test_invalid_selector_fails_before_parsing(tmp_path):
+    settings = Settings(hugo_build=HugoBuildSelectors(title_selector="h1[["))
+    with pytest.raises(ValueError, match="Invalid CSS selector 'h1\\[\\['"):
+        list(iter_hugo_build_posts(tmp_path, settings, [], []))
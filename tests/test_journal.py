@@ -0,0 +1,93 @@
+import json
+from dataclasses import replace
+
+import pytest
+
+from md2wp.bench import FakeWordPress, generate_corpus
+from md2wp.config import ImportMode, Settings
+from md2wp.parsers.markdown import discover_and_parse_markdown
+from md2wp.sinks.journal import Journal
+from md2wp.sinks.wordpress import WordPressClient, publish_to_wordpress
+
+
+def test_journal_round_trip_ignores_torn_lines_and_other_sites(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = Journal(path, "https://a.example")
+    journal.record("one", 1, "created")
+    journal.record("two", 2, "updated")
+    journal.close()
+    with path.open("a", encoding="utf-8") as f:
+        other = {"site": "https://b.example", "slug": "x", "post_id": 9, "action": "created"}
+        f.write(json.dumps(other) + "\n")
+        f.write('{"site": "https://a.example", "slug": "thr')
+
+    resumed = Journal(path, "https://a.example", resume=True)
+    assert resumed.completed == {"one": (1, "created"), "two": (2, "updated")}
+    resumed.close()
+
+    fresh = Journal(path, "https://a.example")
+    assert fresh.completed == {}
+    fresh.close()
+    assert path.read_text() == ""
+
+
+def test_resume_skips_journaled_posts_without_requests(tmp_path, mocker):
+    generate_corpus(tmp_path / "src", 5, ImportMode.MARKDOWN)
+    posts, _, _ = discover_and_parse_markdown(tmp_path / "src", Settings())
+    journal_path = tmp_path / "journal.jsonl"
+    publish_post = WordPressClient.publish_post
+    down = {post.metadata.slug for post in posts[3:]}
+
+    def flaky_publish(self, post):
+        if post.metadata.slug in down:
+            raise RuntimeError("connection reset")
+        return publish_post(self, post)
+
+    with FakeWordPress() as site:
+        settings = Settings(
+            wordpress_url=site.url,
+            wordpress_username="u",
+            wordpress_password="p",
+            journal_path=journal_path,
+        )
+        mocker.patch.object(WordPressClient, "publish_post", flaky_publish)
+        first = publish_to_wordpress(posts, settings)
+        requests_before = site.requests
+
+        down.clear()
+        resumed = publish_to_wordpress(posts, replace(settings, resume=True))
+
+    assert first.published == 3 and first.failed == 2
+    assert resumed.resumed == 3 and resumed.published == 2
+    # Only auth plus the two new posts' lookups, creates and meta went out.
+    assert site.requests - requests_before < requests_before
+    assert len(site.posts) == 5
+    # The run finished cleanly, so a later --resume has nothing to skip.
+    assert journal_path.read_text() == ""
+
+
+def test_interrupted_publish_closes_journal_and_client(tmp_path, mocker):
+    generate_corpus(tmp_path / "src", 2, ImportMode.MARKDOWN)
+    posts, _, _ = discover_and_parse_markdown(tmp_path / "src", Settings())
+    close_client = mocker.spy(WordPressClient, "close")
+    close_journal = mocker.spy(Journal, "close")
+    finish = mocker.spy(Journal, "finish")
+
+    def interrupted():
+        yield from posts
+        raise KeyboardInterrupt
+
+    with FakeWordPress() as site:
+        settings = Settings(
+            wordpress_url=site.url,
+            wordpress_username="u",
+            wordpress_password="p",
+            journal_path=tmp_path / "journal.jsonl",
+            concurrency=1,
+        )
+        with pytest.raises(KeyboardInterrupt):
+            publish_to_wordpress(interrupted(), settings)
+
+    close_client.assert_called_once()
+    close_journal.assert_called_once()
+    finish.assert_not_called()
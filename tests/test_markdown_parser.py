@@ -1,6 +1,19 @@
+import json
+import os
+import pickle
+from dataclasses import replace
+from datetime import date, datetime, timezone
 from pathlib import Path
 
-from md2wp.config import Settings
+import pytest
+
+from md2wp.bench import generate_corpus
+from md2wp.config import ImportMode, Settings
+from md2wp.models import LazyPost
+from md2wp.parsers import front_matter
+from md2wp.parsers import markdown as markdown_parser
+from md2wp.parsers.dates import DateParser
+from md2wp.parsers.front_matter import load_header, read_header
 from md2wp.parsers.markdown import (
     discover_and_parse_markdown,
     parse_date,
@@ -26,6 +39,67 @@ def test_parse_date_rfc2822():
     assert dt.month == 6
 
 
+def test_parse_date_builtin_formats():
+    assert parse_date("2023-06-12 20:40:00") == datetime(2023, 6, 12, 20, 40)
+    assert parse_date(date(2023, 6, 12)) == datetime(2023, 6, 12)
+    # Not misread by the lenient RFC 2822 parser, which would drop the PM.
+    assert parse_date("Jun 12, 2023 08:40 PM +0000") == datetime(
+        2023, 6, 12, 20, 40, tzinfo=timezone.utc
+    )
+    with pytest.raises(ValueError, match="Unsupported date format"):
+        parse_date("12/06/2023")
+    assert parse_date("12/06/2023", ["%d/%m/%Y"]) == datetime(2023, 6, 12)
+
+
+def test_date_parser_only_parses_matching_shapes(mocker):
+    parser = DateParser(["%d.%m.%Y"])
+    calls = []
+
+    class CountingDatetime(datetime):
+        @classmethod
+        def strptime(cls, text, fmt):
+            calls.append(fmt)
+            return datetime.strptime(text, fmt)
+
+    mocker.patch("md2wp.parsers.dates.datetime", CountingDatetime)
+    assert parser.parse("13.06.2023") == datetime(2023, 6, 13)
+    assert parser.parse("Jun 12, 2023 08:40 PM +0000").year == 2023
+    assert calls == ["%d.%m.%Y", "%b %d, %Y %I:%M %p %z"]
+    cached = parser.parse("2024-08-13T16:42:19+03:30")
+    assert parser.parse("2024-08-13T16:42:19+03:30") is cached
+
+
+def test_date_parser_does_not_depend_on_earlier_dates():
+    parser = DateParser(["%d/%m/%Y", "%m/%d/%Y"])
+    assert parser.parse("02/13/2024") == datetime(2024, 2, 13)
+    # Still read with the first configured format, not the last one used.
+    assert parser.parse("01/02/2024") == datetime(2024, 2, 1)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("2016-03-10 10:00:00 +0100", datetime(2016, 3, 10, 9, tzinfo=timezone.utc)),
+        ("2024-01-02t10:00:00", datetime(2024, 1, 2, 10)),
+        ("2024-W01-1", datetime(2024, 1, 1)),
+        ("Sunday, 06-Nov-94 08:49:37 GMT", datetime(1994, 11, 6, 8, 49, 37, tzinfo=timezone.utc)),
+        ("Sun Nov  6 08:49:37 1994", datetime(1994, 11, 6, 8, 49, 37)),
+    ],
+)
+def test_parse_date_lenient_fallbacks(text, expected):
+    assert parse_date(text) == expected
+
+
+def test_custom_date_formats_from_settings(tmp_path):
+    (tmp_path / "post.md").write_text("---\ntitle: T\ndate: 13.08.2024\n---\nBody\n")
+    posts, errors, _ = discover_and_parse_markdown(tmp_path, Settings())
+    assert errors[0].message == "Unsupported date format: '13.08.2024'"
+    posts, errors, _ = discover_and_parse_markdown(
+        tmp_path, Settings(date_formats=["%d.%m.%Y"])
+    )
+    assert not errors and posts[0].metadata.date == datetime(2024, 8, 13)
+
+
 def test_parse_markdown_file():
     settings = Settings(recursive=False, include_drafts=False)
     posts, errors, skipped = discover_and_parse_markdown(FIXTURES, settings)
@@ -52,3 +126,156 @@ def test_includes_drafts_when_requested():
     settings = Settings(recursive=False, include_drafts=True)
     posts, errors, skipped = discover_and_parse_markdown(FIXTURES, settings)
     assert any(p.metadata.title == "Draft Post" for p in posts)
+
+
+def test_parallel_parse_matches_serial():
+    serial = discover_and_parse_markdown(
+        FIXTURES, Settings(recursive=False, include_drafts=True)
+    )
+    parallel = discover_and_parse_markdown(
+        FIXTURES, Settings(recursive=False, include_drafts=True, jobs=2)
+    )
+    assert [p.metadata.slug for p in parallel[0]] == [p.metadata.slug for p in serial[0]]
+    assert [p.html_content for p in parallel[0]] == [p.html_content for p in serial[0]]
+    assert parallel[1:] == serial[1:]
+
+
+def test_parallel_parse_of_unsorted_paths_while_scanning(tmp_path):
+    generate_corpus(tmp_path, 20, ImportMode.MARKDOWN)
+    serial = discover_and_parse_markdown(tmp_path, Settings())
+    streamed = discover_and_parse_markdown(tmp_path, Settings(sort_paths=False, jobs=2))
+    assert sorted(p.metadata.slug for p in streamed[0]) == [p.metadata.slug for p in serial[0]]
+
+
+def test_parse_cache_reuses_unchanged_files(tmp_path, mocker):
+    source = tmp_path / "posts"
+    source.mkdir()
+    post_path = source / "sample-post.en.md"
+    post_path.write_text((FIXTURES / "sample-post.en.md").read_text())
+    settings = Settings(cache_dir=tmp_path / "cache")
+
+    first, _, _ = discover_and_parse_markdown(source, settings)
+    spy = mocker.patch("md2wp.parsers.markdown.parse_markdown_file")
+    second, _, _ = discover_and_parse_markdown(source, settings)
+    spy.assert_not_called()
+    assert second[0].html_content == first[0].html_content
+
+    post_path.write_text(post_path.read_text().replace("backbone", "spine"))
+    mocker.stopall()
+    third, _, _ = discover_and_parse_markdown(source, settings)
+    assert "spine" in third[0].html_content
+
+
+def test_parse_cache_stores_json_and_survives_write_errors(tmp_path, mocker):
+    source = tmp_path / "posts"
+    source.mkdir()
+    post_path = source / "dated.md"
+    post_path.write_text(
+        "---\ntitle: Dated\ndate: 2024-08-13\nupdated: 2024-09-01\n---\nBody\n"
+    )
+    settings = Settings(cache_dir=tmp_path / "cache")
+
+    first, _, _ = discover_and_parse_markdown(source, settings)
+    (entry,) = (tmp_path / "cache").rglob("*.json")
+    assert json.loads(entry.read_text())["fingerprint"]
+
+    parse = mocker.patch("md2wp.parsers.markdown.parse_markdown_file")
+    second, _, _ = discover_and_parse_markdown(source, settings)
+    parse.assert_not_called()
+    assert second[0].metadata == first[0].metadata
+    assert second[0].metadata.extra["updated"] == date(2024, 9, 1)
+
+    # A touched file refreshes its entry; a failing write must not abort the run.
+    os.utime(post_path, ns=(0, 0))
+    mocker.patch("md2wp.parsers.cache.os.replace", side_effect=PermissionError("read-only"))
+    third, errors, _ = discover_and_parse_markdown(source, settings)
+    parse.assert_not_called()
+    assert not errors and third[0].metadata == first[0].metadata
+
+
+def test_parse_cache_keyed_by_settings(tmp_path):
+    settings = Settings(recursive=False, cache_dir=tmp_path / "cache")
+    discover_and_parse_markdown(FIXTURES, settings)
+
+    settings.include_drafts = True
+    posts, _, skipped = discover_and_parse_markdown(FIXTURES, settings)
+    assert any(p.metadata.title == "Draft Post" for p in posts)
+    assert not skipped
+
+
+def test_dry_run_reads_front_matter_only(mocker):
+    render = mocker.spy(markdown_parser, "render_markdown_file")
+    settings = Settings(recursive=False, include_drafts=True, dry_run=True)
+    posts, errors, skipped = discover_and_parse_markdown(FIXTURES, settings)
+    full, _, _ = discover_and_parse_markdown(
+        FIXTURES, Settings(recursive=False, include_drafts=True)
+    )
+
+    assert not errors
+    assert [p.metadata for p in posts] == [p.metadata for p in full]
+    assert all(isinstance(p, LazyPost) and not p.loaded for p in posts)
+    render.assert_not_called()
+    assert [p.html_content for p in posts] == [p.html_content for p in full]
+
+
+def test_lazy_post_survives_pickling():
+    settings = Settings(recursive=False, dry_run=True)
+    posts, _, _ = discover_and_parse_markdown(FIXTURES, settings)
+    clone = pickle.loads(pickle.dumps(posts[0]))
+    assert not clone.loaded
+    assert "<h2>" in clone.html_content
+    assert replace(clone, html_content="<p>x</p>").html_content == "<p>x</p>"
+
+
+def test_read_header_stops_at_closing_delimiter(tmp_path):
+    path = tmp_path / "post.md"
+    path.write_text("+++\ntitle = 'T'\n+++\n" + "body\n" * 1000)
+    assert read_header(path) == "+++\ntitle = 'T'\n+++\n"
+    path.write_text('{\n"title": "T"\n}\nbody\n')
+    assert load_header(path) == {"title": "T"}
+    path.write_text("No front matter\n---\n")
+    assert read_header(path) == ""
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "\n\n---\ntitle: Blank lines first\ndate: 2024-01-02\n---\nBody\n",
+        '{\n"title": "Nested",\n"extra": {\n  "a": {\n    "b": 1\n  }\n  }\n}\nBody\n',
+        "---\ntitle: Indented\nnote: |\n  ---\n  not the end\n---\nBody\n",
+    ],
+)
+def test_load_header_matches_load(tmp_path, text):
+    path = tmp_path / "post.md"
+    path.write_text(text)
+    assert load_header(path) == front_matter.load(path)[0]
+    assert load_header(path)["title"]
+
+
+@pytest.mark.parametrize("fixture", sorted(FIXTURES.glob("*.md")), ids=lambda p: p.name)
+def test_load_header_matches_load_on_fixtures(fixture):
+    assert load_header(fixture) == front_matter.load(fixture)[0]
+
+
+def test_front_matter_styles_parse_alike():
+    expected = {"title": "T", "tags": ["a", "b"]}
+    yaml_text = "---\ntitle: T\ntags: [a, b]\n---\n\nBody\n"
+    toml_text = '+++\ntitle = "T"\ntags = ["a", "b"]\n+++\nBody\n'
+    json_text = '{\n"title": "T",\n"tags": ["a", "b"]\n}\nBody\n'
+    for text in (yaml_text, toml_text, json_text):
+        assert front_matter.parse(text) == (expected, "Body")
+    assert front_matter.parse("Just a body\n---\n") == ({}, "Just a body\n---")
+
+
+def test_front_matter_matches_python_frontmatter():
+    frontmatter = pytest.importorskip("frontmatter")
+    for path in FIXTURES.glob("*.md"):
+        baseline = frontmatter.load(path)
+        assert front_matter.load(path) == (baseline.metadata, baseline.content)
+
+
+def test_invalid_front_matter_is_a_parse_error(tmp_path):
+    (tmp_path / "broken.md").write_text("---\ntitle: [unclosed\n---\nBody\n")
+    posts, errors, _ = discover_and_parse_markdown(tmp_path, Settings())
+    assert posts == []
+    assert errors[0].message.startswith("Invalid front matter")
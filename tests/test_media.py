@@ -0,0 +1,104 @@
+import re
+from dataclasses import replace
+from datetime import datetime
+
+from md2wp.bench import FakeWordPress
+from md2wp.config import Settings
+from md2wp.models import Post, PostMetadata
+from md2wp.sinks.media import find_local_assets
+from md2wp.sinks.wordpress import WordPressClient, publish_to_wordpress
+
+
+def test_find_local_assets():
+    html = (
+        '<p><img src="images/a.png"> <img src="https://cdn.example/b.png">'
+        '<a href="files/report.pdf">pdf</a> <a href="/about/">about</a>'
+        "<img src='/static/c.jpg'> <img src=\"images/a.png\"> <a href=\"#top\">top</a></p>"
+    )
+    assert find_local_assets(html) == ["images/a.png", "files/report.pdf", "/static/c.jpg"]
+
+
+def test_find_local_assets_only_media_elements():
+    html = (
+        '<script src="app.js"></script><iframe src="embed.html"></iframe>'
+        '<img data-src="lazy.png" src="real.png"><video><source src="clip.mp4"></video>'
+        '<link href="style.css">'
+    )
+    assert find_local_assets(html) == ["real.png", "clip.mp4"]
+
+
+def _post(source, slug, html):
+    return Post(
+        metadata=PostMetadata(
+            title=slug, date=datetime(2024, 1, 1), slug=slug, source_path=source
+        ),
+        html_content=html,
+    )
+
+
+def test_media_uploaded_once_and_urls_rewritten(tmp_path):
+    (tmp_path / "posts" / "images").mkdir(parents=True)
+    (tmp_path / "posts" / "images" / "a.png").write_bytes(b"png-bytes")
+    (tmp_path / "posts" / "images" / "copy.png").write_bytes(b"png-bytes")
+    (tmp_path / "static").mkdir()
+    (tmp_path / "static" / "b.jpg").write_bytes(b"jpg-bytes")
+    source = tmp_path / "posts" / "one.md"
+    posts = [
+        _post(source, "one", '<img src="images/a.png"><img src="/static/b.jpg">'),
+        _post(source, "two", '<img src="images/copy.png"><img src="missing.png">'),
+    ]
+
+    with FakeWordPress() as site:
+        settings = Settings(
+            source=tmp_path,
+            wordpress_url=site.url,
+            wordpress_username="u",
+            wordpress_password="p",
+            upload_media=True,
+            state_path=tmp_path / "state.sqlite3",
+        )
+        result = publish_to_wordpress(posts, settings)
+        # A second run finds every file in the content-hash index.
+        again = publish_to_wordpress(posts, replace(settings, incremental=True))
+
+    assert result.published == 2 and again.failed == 0
+    assert len(site.media) == 2
+    contents = {post["slug"]: post["content"] for post in site.posts.values()}
+    assert "wp-content/uploads" in contents["one"]
+    assert "images/a.png" not in contents["one"] and "/static/b.jpg" not in contents["one"]
+    first_image = re.search(r'src="([^"]+)"', contents["one"]).group(1)
+    assert re.search(r'src="([^"]+)"', contents["two"]).group(1) == first_image
+    assert 'src="missing.png"' in contents["two"]
+
+
+def test_media_confined_to_source_and_failures_isolated(tmp_path, mocker):
+    (tmp_path / "secret.png").write_bytes(b"secret")
+    (tmp_path / "site" / "posts").mkdir(parents=True)
+    (tmp_path / "site" / "posts" / "ok.png").write_bytes(b"ok")
+    (tmp_path / "site" / "posts" / "bad.png").write_bytes(b"bad")
+    source = tmp_path / "site" / "posts" / "one.md"
+    html = '<img src="../../secret.png"><img src="ok.png"><img src="bad.png">'
+
+    with FakeWordPress() as site:
+        settings = Settings(
+            source=tmp_path / "site",
+            wordpress_url=site.url,
+            wordpress_username="u",
+            wordpress_password="p",
+            upload_media=True,
+            state_path=None,
+        )
+        upload = WordPressClient.upload_media
+
+        def flaky_upload(self, path):
+            if path.name == "bad.png":
+                raise OSError("boom")
+            return upload(self, path)
+
+        mocker.patch.object(WordPressClient, "upload_media", flaky_upload)
+        result = publish_to_wordpress([_post(source, "one", html)], settings)
+
+    assert result.published == 1 and result.failed == 0
+    assert [m["source_url"].rsplit("/", 1)[1] for m in site.media.values()] == ["ok.png"]
+    content = next(iter(site.posts.values()))["content"]
+    assert 'src="../../secret.png"' in content and 'src="bad.png"' in content
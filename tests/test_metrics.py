@@ -0,0 +1,51 @@
+import json
+from pathlib import Path
+
+from md2wp import metrics
+from md2wp.bench import FakeWordPress, generate_corpus
+from md2wp.config import ImportMode, Settings
+from md2wp.pipeline import run_import
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_disabled_metrics_are_no_ops():
+    assert not metrics.enabled()
+    with metrics.timer("anything"):
+        pass
+    assert list(metrics.timed_iter("stage", [1, 2])) == [1, 2]
+
+
+def test_collect_writes_stage_post_and_http_metrics(tmp_path):
+    generate_corpus(tmp_path / "src", 3, ImportMode.MARKDOWN)
+    out = tmp_path / "metrics.json"
+
+    with FakeWordPress() as site:
+        settings = Settings(
+            source=tmp_path / "src",
+            wordpress_url=site.url,
+            wordpress_username="u",
+            wordpress_password="p",
+        )
+        with metrics.collect(out):
+            result = run_import(settings)
+
+    assert result.published == 3
+    assert not metrics.enabled()
+    report = json.loads(out.read_text())
+    timings = report["timings"]
+    for name in ("stage.parse", "stage.publish", "post.parse", "parse.render", "post.publish"):
+        assert name in timings
+    assert timings["post.parse"]["count"] == 3
+    assert report["http"]["POST /posts"]["201"]["count"] == 3
+    assert "POST /posts/{id}/meta" in report["http"]
+    assert report["retries"] == {"count": 0, "wait_seconds": 0}
+
+
+def test_worker_process_samples_are_merged(tmp_path):
+    out = tmp_path / "metrics.json"
+    with metrics.collect(out):
+        run_import(Settings(source=FIXTURES, dry_run=True, jobs=2))
+
+    report = json.loads(out.read_text())
+    assert report["timings"]["parse.front_matter"]["count"] >= 1
@@ -0,0 +1,61 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from md2wp.sinks.ratelimit import RateLimiter, backoff_delay, parse_retry_after
+
+
+def test_parse_retry_after_seconds_and_http_date():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(" 1.5 ") == 1.5
+    when = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 < parse_retry_after(format_datetime(when, usegmt=True)) <= 30
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_backoff_delay_is_jittered_and_capped():
+    assert all(4 <= backoff_delay(3) <= 8 for _ in range(50))
+    assert all(10 <= backoff_delay(0, retry_after=10) <= 12 for _ in range(50))
+    assert all(120 <= backoff_delay(0, retry_after=120) <= 144 for _ in range(50))
+    assert backoff_delay(20) <= 60
+
+
+def test_token_bucket_limits_rate():
+    limiter = RateLimiter(requests_per_second=50, burst=1, max_concurrency=4)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+        limiter.release()
+    assert time.monotonic() - start >= 0.09
+
+
+def test_aimd_halves_on_throttle_and_recovers():
+    limiter = RateLimiter(max_concurrency=8)
+    limiter.acquire()
+    limiter.release(success=False, pause=0.01)
+    assert limiter.limit == 4
+    for _ in range(40):
+        limiter.acquire()
+        limiter.release()
+    assert limiter.limit == 8
+
+
+def test_concurrency_limit_blocks_extra_requests():
+    limiter = RateLimiter(max_concurrency=1)
+    limiter.acquire()
+    entered = threading.Event()
+
+    def worker():
+        limiter.acquire()
+        entered.set()
+        limiter.release()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    assert not entered.wait(0.05)
+    limiter.release()
+    assert entered.wait(1)
+    thread.join()
@@ -0,0 +1,57 @@
+from pathlib import Path
+
+import pytest
+
+from md2wp.config import Settings
+from md2wp.parsers import front_matter
+from md2wp.parsers.markdown import parse_markdown_file
+from md2wp.parsers.renderers import get_renderer
+
+FIXTURES = Path(__file__).parent / "fixtures"
+EXTENSIONS = ["fenced_code", "tables", "nl2br"]
+
+TABLE = """\
+| Name | Year |
+| --- | --- |
+| Befunge | 1993 |
+| Brainfuck | 1993 |
+"""
+
+
+@pytest.mark.parametrize("fixture", ["sample-post.en.md", "draft-post.md"])
+def test_renderer_matches_python_markdown_on_fixture(renderer, fixture, normalize_html):
+    body = front_matter.load(FIXTURES / fixture)[1]
+    expected = get_renderer("python-markdown", EXTENSIONS)(body)
+    assert normalize_html(get_renderer(renderer, EXTENSIONS)(body)) == normalize_html(expected)
+
+
+def test_renderer_matches_python_markdown_on_table(renderer, normalize_html):
+    expected = get_renderer("python-markdown", EXTENSIONS)(TABLE)
+    assert normalize_html(get_renderer(renderer, EXTENSIONS)(TABLE)) == normalize_html(expected)
+
+
+def test_renderer_is_reused_and_reset_between_documents(renderer):
+    render = get_renderer(renderer, EXTENSIONS)
+    assert get_renderer(renderer, EXTENSIONS) is render
+    first = render("Text with a [link][ref].\n\n[ref]: https://example.com\n")
+    second = render("A [link][ref] without a definition.\n")
+    assert "https://example.com" in first
+    assert "https://example.com" not in second
+
+
+def test_parse_markdown_file_uses_configured_renderer(renderer):
+    settings = Settings(markdown_renderer=renderer)
+    post = parse_markdown_file(FIXTURES / "sample-post.en.md", settings)
+    assert '<code class="language-python">' in post.html_content
+    assert "<h2" in post.html_content
+
+
+def test_unknown_renderer_is_rejected():
+    with pytest.raises(ValueError, match="Unknown markdown.renderer"):
+        get_renderer("pandoc", EXTENSIONS)
+
+
+def test_commonmark_renderer_rejects_unsupported_extensions():
+    pytest.importorskip("markdown_it")
+    with pytest.raises(ValueError, match="toc"):
+        get_renderer("markdown-it", ["fenced_code", "toc"])
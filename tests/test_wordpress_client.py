@@ -1,6 +1,13 @@
+import gzip
+import json
+import threading
+import time
 from datetime import datetime
 from unittest.mock import MagicMock
 
+import pytest
+import requests
+
 from md2wp.config import PostStatus, Settings
 from md2wp.models import Post, PostMetadata
 from md2wp.sinks.wordpress import WordPressClient, publish_to_wordpress
@@ -100,3 +107,467 @@ def test_publish_to_wordpress_counts_failures(mocker):
     result = publish_to_wordpress([_sample_post("a"), _sample_post("b")], settings)
     assert result.published == 1
     assert result.failed == 1
+
+
+def test_incremental_publish_uses_sync_state(mocker, tmp_path):
+    settings = Settings(
+        wordpress_url="https://example.com/wp-json/wp/v2",
+        wordpress_username="admin",
+        wordpress_password="secret",
+        state_path=tmp_path / "sync-state.sqlite3",
+        incremental=True,
+    )
+    client = WordPressClient(settings)
+    client._tag_cache["go"] = 10
+    client._category_cache["techblog"] = 20
+
+    calls = []
+    responses = {
+        ("GET", "/posts"): MagicMock(status_code=200, json=lambda: []),
+        ("POST", "/posts"): MagicMock(status_code=201, ok=True, json=lambda: {"id": 100}),
+        ("PUT", "/posts/100"): MagicMock(status_code=200, json=lambda: {"id": 100}),
+        ("POST", "/posts/100/meta"): MagicMock(status_code=201, json=lambda: {}),
+    }
+
+    def fake_request(method, path, **kwargs):
+        calls.append((method, path))
+        return responses[(method, path)]
+
+    mocker.patch.object(client, "_request", side_effect=fake_request)
+
+    assert client.publish_post(_sample_post()) == ("created", 100)
+
+    calls.clear()
+    assert client.publish_post(_sample_post()) == ("unchanged", 100)
+    assert calls == []
+
+    changed = _sample_post()
+    changed.html_content = "<p>Changed</p>"
+    assert client.publish_post(changed) == ("updated", 100)
+    assert ("GET", "/posts") not in calls
+    assert calls[0] == ("PUT", "/posts/100")
+
+
+def test_concurrent_publish_creates_each_term_once(mocker):
+    settings = Settings(
+        wordpress_url="https://example.com/wp-json/wp/v2",
+        wordpress_username="admin",
+        wordpress_password="secret",
+        concurrency=4,
+    )
+    client = WordPressClient(settings)
+    mocker.patch.object(client, "_ensure_auth")
+    mocker.patch("md2wp.sinks.wordpress.WordPressClient", return_value=client)
+
+    calls = []
+    lock = threading.Lock()
+    post_ids = iter(range(100, 200))
+
+    def fake_request(method, path, **kwargs):
+        with lock:
+            calls.append((method, path))
+        time.sleep(0.01)
+        if method == "GET":
+            return MagicMock(status_code=200, json=lambda: [])
+        if path in ("/tags", "/categories"):
+            return MagicMock(status_code=201, json=lambda: {"id": 10})
+        if path == "/posts":
+            with lock:
+                post_id = next(post_ids)
+            return MagicMock(status_code=201, ok=True, json=lambda: {"id": post_id})
+        return MagicMock(status_code=201, json=lambda: {})
+
+    mocker.patch.object(client, "_request", side_effect=fake_request)
+
+    posts = [_sample_post(f"post-{i}") for i in range(8)]
+    result = publish_to_wordpress(posts, settings)
+    assert result.published == 8
+    assert result.failed == 0
+    assert calls.count(("POST", "/tags")) == 1
+    assert calls.count(("POST", "/categories")) == 1
+
+
+def test_request_uses_pooled_session_and_gzip(mocker):
+    settings = Settings(
+        wordpress_url="https://example.com/wp-json/wp/v2",
+        wordpress_username="admin",
+        wordpress_password="secret",
+        compress_requests=True,
+        compress_min_bytes=100,
+    )
+    client = WordPressClient(settings)
+    send = mocker.patch.object(
+        client.session, "request", return_value=MagicMock(status_code=200)
+    )
+
+    client._request("POST", "/posts", json={"content": "x" * 1000})
+    client._request("POST", "/posts/1/meta", json={"key": "lang", "value": "en"})
+
+    big, small = send.call_args_list
+    assert gzip.decompress(big.kwargs["data"]) == json.dumps({"content": "x" * 1000}).encode()
+    assert big.kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert small.kwargs["json"] == {"key": "lang", "value": "en"}
+    assert client.session.get_adapter("https://example.com")._pool_maxsize == 10
+
+
+def test_prefetch_posts_replaces_slug_lookups(mocker):
+    settings = Settings(
+        wordpress_url="https://example.com/wp-json/wp/v2",
+        wordpress_username="admin",
+        wordpress_password="secret",
+    )
+    client = WordPressClient(settings)
+    pages = {
+        1: [{"id": 55, "slug": "my-post"}],
+        2: [{"id": 56, "slug": "%d8%b3%d9%84%d8%a7%d9%85"}],
+    }
+
+    def fake_request(method, path, **kwargs):
+        page = kwargs["params"]["page"]
+        return MagicMock(
+            status_code=200, headers={"X-WP-TotalPages": "2"}, json=lambda: pages[page]
+        )
+
+    request = mocker.patch.object(client, "_request", side_effect=fake_request)
+    client.prefetch_posts()
+    assert request.call_count == 2
+
+    assert client._find_post_by_slug("my-post")["id"] == 55
+    assert client._find_post_by_slug("سلام")["id"] == 56
+    assert client._find_post_by_slug("missing") is None
+    assert request.call_count == 2
+
+
+def test_prefetched_index_matches_sanitized_slugs(mocker):
+    settings = Settings(
+        wordpress_url="https://example.com/wp-json/wp/v2",
+        wordpress_username="admin",
+        wordpress_password="secret",
+    )
+    client = WordPressClient(settings)
+    pages = [{"id": 55, "slug": "my-post"}, {"id": 56, "slug": "cafe-deja-vu"}]
+
+    def fake_request(method, path, **kwargs):
+        if "page" in kwargs["params"]:
+            return MagicMock(status_code=200, headers={}, json=lambda: pages)
+        return MagicMock(status_code=200, json=lambda: [{"id": 57, "slug": "odd-one"}])
+
+    request = mocker.patch.object(client, "_request", side_effect=fake_request)
+    client.prefetch_posts()
+
+    assert client._find_post_by_slug("My Post")["id"] == 55
+    assert client._find_post_by_slug("Café Déjà vu")["id"] == 56
+    assert request.call_count == 1
+    # Unsanitized slugs that miss the index fall back to the server's lookup.
+    assert client._find_post_by_slug("Odd One!")["id"] == 57
+    assert client._find_post_by_slug("missing") is None
+    assert request.call_count == 2
+
+
+def test_preload_and_create_missing_terms(mocker):
+    settings = Settings(
+        wordpress_url="https://example.com/wp-json/wp/v2",
+        wordpress_username="admin",
+        wordpress_password="secret",
+    )
+    client = WordPressClient(settings)
+    listings = {
+        "/tags": [{"id": 10, "name": "Go"}, {"id": 11, "name": "Q&amp;A"}],
+        "/categories": [],
+    }
+    calls = []
+
+    def fake_request(method, path, **kwargs):
+        calls.append((method, path))
+        if method == "GET":
+            return MagicMock(status_code=200, headers={}, json=lambda: listings[path])
+        return MagicMock(status_code=201, json=lambda: {"id": 20})
+
+    mocker.patch.object(client, "_request", side_effect=fake_request)
+    client.preload_terms()
+
+    post = _sample_post()
+    post.metadata.tags = ["Go", "Q&A"]
+    client.create_missing_terms([post, _sample_post("other")])
+
+    assert calls.count(("POST", "/categories")) == 1
+    assert ("POST", "/tags") not in calls
+    assert client._resolve_tags(post.metadata.tags) == [10, 11]
+    assert client._resolve_categories(["techblog"]) == [20]
+    assert sorted(calls) == sorted(
+        [("GET", "/tags"), ("GET", "/categories"), ("POST", "/categories")]
+    )
+
+
+def _forbidden():
+    response = requests.Response()
+    response.status_code = 403
+    response._content = b'{"code": "rest_forbidden"}'
+    return response
+
+
+def test_refused_term_creation_fails_only_its_posts(mocker):
+    settings = Settings(
+        wordpress_url="https://example.com/wp-json/wp/v2",
+        wordpress_username="admin",
+        wordpress_password="secret",
+        preload_terms=True,
+    )
+    calls = []
+
+    def fake_request(self, method, path, **kwargs):
+        calls.append((method, path))
+        if (method, path) == ("POST", "/categories"):
+            return _forbidden()
+        if method == "GET":
+            return MagicMock(status_code=200, headers={}, json=lambda: [])
+        return MagicMock(status_code=201, ok=True, json=lambda: {"id": 30})
+
+    mocker.patch.object(WordPressClient, "_request", fake_request)
+    other = _sample_post("other")
+    other.metadata.categories = []
+    result = publish_to_wordpress([_sample_post(), other], settings)
+
+    assert result.published == 1 and result.failed == 1
+    # Refused once up front, then retried by the post that needs it.
+    assert calls.count(("POST", "/categories")) == 2
+
+
+def test_preload_failure_is_reported_as_configuration_error(mocker):
+    settings = Settings(
+        wordpress_url="https://example.com/wp-json/wp/v2",
+        wordpress_username="admin",
+        wordpress_password="secret",
+        prefetch_posts=True,
+    )
+
+    def fake_request(self, method, path, **kwargs):
+        if path == "/posts":
+            return _forbidden()
+        return MagicMock(status_code=200, headers={}, json=lambda: [])
+
+    mocker.patch.object(WordPressClient, "_request", fake_request)
+    with pytest.raises(ValueError, match="Could not preload"):
+        publish_to_wordpress([_sample_post()], settings)
+
+
+def test_publish_batch_groups_writes_and_meta(mocker):
+    settings = Settings(
+        wordpress_url="https://example.com/wp-json/wp/v2",
+        wordpress_username="admin",
+        wordpress_password="secret",
+        batch=True,
+    )
+    client = WordPressClient(settings)
+    client._tag_cache["go"] = 10
+    client._category_cache["techblog"] = 20
+    client._slug_index = {"existing": {"id": 55, "slug": "existing"}}
+    batches = []
+
+    def fake_send(method, url, **kwargs):
+        assert url == "https://example.com/wp-json/batch/v1"
+        sub_requests = kwargs["json"]["requests"]
+        batches.append(sub_requests)
+        responses = [
+            {"status": 200 if r["method"] == "PUT" else 201, "body": {"id": 100 + i}}
+            for i, r in enumerate(sub_requests)
+        ]
+        return MagicMock(status_code=207, json=lambda: {"responses": responses})
+
+    mocker.patch.object(client, "_send", side_effect=fake_send)
+
+    outcomes = client.publish_batch([_sample_post("existing"), _sample_post("new")])
+    assert outcomes == [("updated", 55), ("created", 101)]
+    assert len(batches) == 2
+    assert [(r["method"], r["path"]) for r in batches[0]] == [
+        ("PUT", "/wp/v2/posts/55"),
+        ("POST", "/wp/v2/posts"),
+    ]
+    assert {r["path"] for r in batches[1]} == {"/wp/v2/posts/55/meta", "/wp/v2/posts/101/meta"}
+    assert len(batches[1]) == 4
+
+
+def test_publish_batch_falls_back_without_batch_api(mocker):
+    settings = Settings(
+        wordpress_url="https://example.com/wp-json/wp/v2",
+        wordpress_username="admin",
+        wordpress_password="secret",
+        batch=True,
+    )
+    client = WordPressClient(settings)
+    client._slug_index = {}
+    mocker.patch.object(client, "_build_payload", return_value={})
+    mocker.patch.object(client, "_send", return_value=MagicMock(status_code=404))
+    publish = mocker.patch.object(client, "publish_post", return_value=("created", 7))
+
+    assert client.publish_batch([_sample_post("a"), _sample_post("b")]) == [
+        ("created", 7),
+        ("created", 7),
+    ]
+    assert publish.call_count == 2
+    assert client._batch_supported is False
+
+
+def test_meta_in_payload_sends_only_changed_meta(mocker):
+    settings = Settings(
+        wordpress_url="https://example.com/wp-json/wp/v2",
+        wordpress_username="admin",
+        wordpress_password="secret",
+        meta_in_payload=True,
+    )
+    client = WordPressClient(settings)
+    client._tag_cache["go"] = 10
+    client._category_cache["techblog"] = 20
+    existing = {"id": 55, "slug": "my-post", "meta": {"lang": "en", "shortlink": ""}}
+    calls = []
+
+    def fake_request(method, path, **kwargs):
+        calls.append((method, path, kwargs))
+        if method == "GET":
+            return MagicMock(status_code=200, json=lambda: [existing])
+        return MagicMock(status_code=200, json=lambda: {"id": 55})
+
+    mocker.patch.object(client, "_request", side_effect=fake_request)
+
+    assert client.publish_post(_sample_post()) == ("updated", 55)
+    assert [(method, path) for method, path, _ in calls] == [
+        ("GET", "/posts"),
+        ("PUT", "/posts/55"),
+    ]
+    assert calls[1][2]["json"]["meta"] == {"shortlink": "https://example.com/s/abc"}
+
+
+def test_state_sourced_update_sends_only_changed_meta(mocker, tmp_path):
+    settings = Settings(
+        wordpress_url="https://example.com/wp-json/wp/v2",
+        wordpress_username="admin",
+        wordpress_password="secret",
+        state_path=tmp_path / "sync-state.sqlite3",
+        meta_in_payload=True,
+    )
+    client = WordPressClient(settings)
+    client._tag_cache["go"] = 10
+    client._category_cache["techblog"] = 20
+    client.state.record("my-post", 55, "stale")
+    meta = {"lang": "en", "shortlink": "https://example.com/s/abc"}
+    client._slug_index = {"my-post": {"id": 55, "slug": "my-post", "meta": meta}}
+    calls = []
+
+    def fake_request(method, path, **kwargs):
+        calls.append((method, path, kwargs))
+        return MagicMock(status_code=200, json=lambda: {"id": 55})
+
+    mocker.patch.object(client, "_request", side_effect=fake_request)
+
+    assert client.publish_post(_sample_post()) == ("updated", 55)
+    assert [(method, path) for method, path, _ in calls] == [("PUT", "/posts/55")]
+    assert "meta" not in calls[0][2]["json"]
+
+
+def test_publish_to_wordpress_consumes_posts_lazily(mocker):
+    settings = Settings(
+        wordpress_url="https://example.com/wp-json/wp/v2",
+        wordpress_username="admin",
+        wordpress_password="secret",
+    )
+    client = WordPressClient(settings)
+    mocker.patch.object(client, "_ensure_auth")
+    mocker.patch("md2wp.sinks.wordpress.WordPressClient", return_value=client)
+    produced = []
+    published = []
+
+    def posts():
+        for i in range(10):
+            produced.append(i)
+            yield _sample_post(f"post-{i}")
+
+    def fake_publish(post):
+        published.append(post.metadata.slug)
+        # Only a bounded window of posts has been pulled from the generator.
+        assert len(produced) - len(published) <= 2
+        return "created", len(published)
+
+    mocker.patch.object(client, "publish_post", side_effect=fake_publish)
+
+    result = publish_to_wordpress(posts(), settings)
+    assert result.published == 10
+    assert result.posts == []
+
+
+def test_throttled_requests_pause_and_shrink_concurrency(mocker):
+    settings = Settings(
+        wordpress_url="https://example.com/wp-json/wp/v2",
+        wordpress_username="admin",
+        wordpress_password="secret",
+        concurrency=8,
+        pool_size=8,
+    )
+    client = WordPressClient(settings)
+    throttled = MagicMock(status_code=429, headers={"Retry-After": "0.05"})
+    ok = MagicMock(status_code=200, headers={})
+    mocker.patch.object(client.session, "request", side_effect=[throttled, ok])
+    sleep = mocker.patch("md2wp.sinks.wordpress.time.sleep")
+
+    start = time.monotonic()
+    assert client._request("GET", "/posts") is ok
+    assert time.monotonic() - start >= 0.05
+    sleep.assert_not_called()  # the limiter pauses instead of the calling thread
+    assert client.limiter.limit < 8
+
+
+def test_request_gives_up_after_max_retries(mocker):
+    settings = Settings(
+        wordpress_url="https://example.com/wp-json/wp/v2",
+        wordpress_username="admin",
+        wordpress_password="secret",
+        max_retries=1,
+    )
+    client = WordPressClient(settings)
+    failing = MagicMock(status_code=502, headers={})
+    send = mocker.patch.object(client.session, "request", return_value=failing)
+    mocker.patch("md2wp.sinks.wordpress.time.sleep")
+
+    assert client._request("GET", "/posts").status_code == 502
+    assert send.call_count == 2
+
+
+def test_long_retry_after_is_honoured_or_fails(mocker):
+    settings = Settings(
+        wordpress_url="https://example.com/wp-json/wp/v2",
+        wordpress_username="admin",
+        wordpress_password="secret",
+        max_retries=2,
+    )
+    client = WordPressClient(settings)
+    ok = MagicMock(status_code=200, headers={})
+    send = mocker.patch.object(
+        client.session,
+        "request",
+        side_effect=[MagicMock(status_code=503, headers={"Retry-After": "120"}), ok],
+    )
+    delay = mocker.patch("md2wp.sinks.wordpress.backoff_delay", return_value=0.01)
+
+    assert client._request("GET", "/posts") is ok
+    delay.assert_called_once_with(0, 120.0)
+
+    send.reset_mock(side_effect=True)
+    send.return_value = MagicMock(status_code=429, headers={"Retry-After": "3600"})
+    assert client._request("GET", "/posts").status_code == 429
+    assert send.call_count == 1
+
+
+def test_exhausted_throttling_does_not_grow_concurrency(mocker):
+    settings = Settings(
+        wordpress_url="https://example.com/wp-json/wp/v2",
+        wordpress_username="admin",
+        wordpress_password="secret",
+        max_retries=0,
+    )
+    client = WordPressClient(settings)
+    client.limiter.limit = 2.0
+    mocker.patch.object(
+        client.session, "request", return_value=MagicMock(status_code=429, headers={})
+    )
+
+    assert client._request("GET", "/posts").status_code == 429
+    assert client.limiter.limit == 2.0
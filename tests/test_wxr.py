@@ -1,3 +1,5 @@
+import hashlib
+import json
 from datetime import datetime
 
 from md2wp.config import PostStatus, Settings
@@ -37,3 +39,65 @@ def test_export_to_wxr(tmp_path):
     assert "domain=\"post_tag\"" in xml
     assert "domain=\"category\"" in xml
     assert "<![CDATA[<p>Body & content</p>]]>" in xml
+
+
+def test_export_to_wxr_streams_from_iterator(tmp_path):
+    output = tmp_path / "nested" / "export.xml"
+    settings = Settings(output=output, domain="https://example.com")
+
+    def posts():
+        for slug in ("one", "two", "three"):
+            post = _sample_post()
+            post.metadata.slug = slug
+            yield post
+
+    result = export_to_wxr(posts(), settings)
+    xml = output.read_text(encoding="utf-8")
+
+    assert result.exported == 3
+    assert xml.count("<item>") == 3
+    assert xml.endswith("</channel>\n</rss>\n")
+    assert not list(output.parent.glob(".*.tmp"))
+
+
+def test_export_to_wxr_shards(tmp_path):
+    output = tmp_path / "site.xml"
+    settings = Settings(output=output, domain="https://example.com", max_items=2, jobs=2)
+    posts = []
+    for slug in ("one", "two", "three"):
+        post = _sample_post()
+        post.metadata.slug = slug
+        posts.append(post)
+
+    result = export_to_wxr(posts, settings)
+    manifest = json.loads((tmp_path / "site-manifest.json").read_text())
+
+    assert result.exported == 3
+    assert result.export_path == tmp_path / "site-manifest.json"
+    assert [s["file"] for s in manifest["shards"]] == ["site-0001.xml", "site-0002.xml"]
+    assert [s["posts"] for s in manifest["shards"]] == [2, 1]
+    for shard in manifest["shards"]:
+        data = (tmp_path / shard["file"]).read_bytes()
+        assert hashlib.sha256(data).hexdigest() == shard["sha256"]
+        assert data.startswith(b'<?xml version="1.0"')
+        assert data.endswith(b"</channel>\n</rss>\n")
+
+    settings.max_items = 5
+    export_to_wxr(posts, settings)
+    assert not (tmp_path / "site-0002.xml").exists()
+
+
+def test_stale_shard_cleanup_ignores_foreign_names(tmp_path):
+    output = tmp_path / "out" / "site.xml"
+    output.parent.mkdir()
+    victim = tmp_path / "victim.txt"
+    victim.write_text("keep me")
+    other = output.parent / "notes.xml"
+    other.write_text("keep me too")
+    manifest = {"shards": [{"file": "../victim.txt"}, {"file": "notes.xml"}, {"file": 3}]}
+    (output.parent / "site-manifest.json").write_text(json.dumps(manifest))
+
+    settings = Settings(output=output, domain="https://example.com", max_items=2)
+    export_to_wxr([_sample_post()], settings)
+
+    assert victim.exists() and other.exists()